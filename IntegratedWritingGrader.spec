@@ -16,6 +16,8 @@ a = Analysis(
     datas=[
         # テンプレートリソース
         ('app/resources/templates', 'app/resources/templates'),
+        # スタイルシート
+        ('app/resources/styles', 'app/resources/styles'),
     ],
     hiddenimports=[
         'PyQt6.QtCore',
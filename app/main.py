@@ -11,6 +11,7 @@ sys.path.insert(0, str(app_path.parent))
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QTimer
 from app.main_window import MainWindow
+from app.utils.config import Config
 from app.utils.updater import UpdateChecker
 from app.widgets.update_dialog import UpdateDialog
 
@@ -48,6 +49,11 @@ def main():
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
+    # 共通スタイルシート（ウィジェットごとの setStyleSheet を置き換え、CSSの解析を1回にする）
+    stylesheet = Config.STYLES_PATH / "app.qss"
+    if stylesheet.exists():
+        app.setStyleSheet(stylesheet.read_text(encoding="utf-8"))
+
     window = MainWindow()
     window.show()
 
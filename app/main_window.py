@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 import json
-import subprocess
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QListWidget, QListWidgetItem,
     QLabel, QStatusBar, QMessageBox,
     QDialog, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QProcess
 from PyQt6.QtGui import QAction
 
 from app.widgets.pdf_loader_panel import PdfLoaderPanel
@@ -510,10 +509,7 @@ class MainWindow(QMainWindow):
         self.statusbar.showMessage(f"PDF出力完了: {file_path}")
         QMessageBox.information(self, "出力完了", f"PDFを出力しました:\n{file_path}")
 
-        try:
-            subprocess.run(["open", "-R", file_path], check=False)
-        except Exception:
-            pass
+        QProcess.startDetached("open", ["-R", file_path])
 
     def _on_save_requested(self):
         """採点結果の保存リクエスト"""
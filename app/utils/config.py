@@ -3,7 +3,9 @@
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import json
+import os
 
 
 class Config:
@@ -15,12 +17,15 @@ class Config:
     # アプリ内リソース（バンドル用）
     _APP_ROOT = Path(__file__).parent.parent  # app/ ディレクトリ
     TEMPLATES_PATH = _APP_ROOT / "resources" / "templates"
+    STYLES_PATH = _APP_ROOT / "resources" / "styles"
 
     # 週別問題（アプリデータフォルダに一元化）
     WEEKS_PATH = APP_DATA_DIR / "weeks"
 
     # スタンプフォルダ
     STAMPS_PATH = APP_DATA_DIR / "stamps"
+    STAMP_THUMBS_PATH = APP_DATA_DIR / "stamp_thumbs"  # 管理画面用サムネイルのキャッシュ
+    STAMP_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")  # スタンプとして扱う画像の拡張子
 
     # デフォルトのスタンプカテゴリ（12点満点ベース）
     DEFAULT_STAMP_CATEGORIES = [
@@ -361,6 +366,12 @@ class Config:
         """週のパス（プロンプト等）を取得"""
         return cls.WEEKS_PATH / term / f"第{week:02d}週"
 
+    @classmethod
+    @lru_cache(maxsize=128)
+    def get_week_path_cached(cls, term: str, week: int) -> Path:
+        """週のパスを取得（学期・週番号ごとに使い回す）"""
+        return cls.get_week_path(term, week)
+
     @classmethod
     def list_saved_weeks(cls) -> list[dict]:
         """保存済みの週一覧を取得
@@ -553,9 +564,12 @@ class Config:
         if not category_path.exists():
             return []
 
-        stamps = []
-        for ext in ["*.png", "*.jpg", "*.jpeg", "*.gif"]:
-            stamps.extend(category_path.glob(ext))
+        # 拡張子ごとに glob すると4回走査するため、scandir の1回の走査で判定する
+        with os.scandir(category_path) as entries:
+            stamps = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(cls.STAMP_EXTENSIONS) and entry.is_file()
+            ]
         return sorted(stamps)
 
     @classmethod
@@ -5,6 +5,7 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
 import csv
+import os
 
 
 @dataclass
@@ -254,31 +255,37 @@ def find_scancrop_output(work_dir: Path) -> list[StudentInfo]:
     Returns:
         StudentInfoのリスト
     """
-    students = []
-
-    # tetex scancropのQRcode.txtを優先検索
-    for txt_file in work_dir.glob("*-QRcode.txt"):
-        parsed = parse_scancrop_qrcode_txt(txt_file)
-        if parsed:
-            students.extend(parsed)
-            return students
-
-    # CSVファイルを検索（DyNAMiKS用）
-    for csv_file in work_dir.glob("*.csv"):
-        parsed = parse_dynamiks_csv(csv_file)
-        if parsed:
-            students.extend(parsed)
-            return students
-
-    # その他のテキストファイルを検索
-    for txt_file in work_dir.glob("*.txt"):
-        if not txt_file.name.endswith("-QRcode.txt"):
-            parsed = parse_dynamiks_output_txt(txt_file)
+    # ディレクトリは1回だけ走査し、種類ごとに振り分ける
+    qrcode_txts: list[Path] = []
+    csv_files: list[Path] = []
+    other_txts: list[Path] = []
+    try:
+        with os.scandir(work_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not entry.is_file():
+                    continue
+                if name.endswith("-QRcode.txt"):
+                    qrcode_txts.append(Path(entry.path))
+                elif name.endswith(".csv"):
+                    csv_files.append(Path(entry.path))
+                elif name.endswith(".txt"):
+                    other_txts.append(Path(entry.path))
+    except OSError:
+        return []
+
+    # tetex scancropのQRcode.txtを優先、次にCSV（DyNAMiKS用）、その他のテキストファイル
+    for files, parser in (
+        (qrcode_txts, parse_scancrop_qrcode_txt),
+        (csv_files, parse_dynamiks_csv),
+        (other_txts, parse_dynamiks_output_txt),
+    ):
+        for path in files:
+            parsed = parser(path)
             if parsed:
-                students.extend(parsed)
-                return students
+                return parsed
 
-    return students
+    return []
 
 
 # 後方互換性のためのエイリアス
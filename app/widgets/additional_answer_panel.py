@@ -3,7 +3,6 @@
 from __future__ import annotations
 import json
 import re
-import subprocess
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
@@ -11,7 +10,7 @@ from PyQt6.QtWidgets import (
     QGroupBox, QCheckBox, QProgressBar, QFileDialog,
     QMessageBox, QComboBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QProcess
 from PyQt6.QtGui import QShortcut, QKeySequence
 
 from app.widgets.pdf_preview import PDFPreviewWidget
@@ -779,10 +778,7 @@ class AdditionalAnswerPanel(QWidget):
             self.status_message.emit(f"追加答案PDF出力完了: {file_path}")
             QMessageBox.information(self, "出力完了", f"PDFを出力しました:\n{file_path}")
 
-            try:
-                subprocess.run(["open", "-R", file_path], check=False)
-            except Exception:
-                pass
+            QProcess.startDetached("open", ["-R", file_path])
 
         except Exception as e:
             QMessageBox.critical(self, "出力エラー", str(e))
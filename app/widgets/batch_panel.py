@@ -34,6 +34,14 @@ class BatchPanel(QWidget):
     batch_finished = pyqtSignal(list)  # 処理結果リスト
     job_selected = pyqtSignal(str)  # 選択されたPDFパス
 
+    # ステータスごとの文字色
+    STATUS_COLORS = {
+        "待機中": "#6b6b6b",
+        "処理中": "#2eaadc",
+        "完了": "#00a86b",
+        "エラー": "#ff6b6b",
+    }
+
     def __init__(self):
         super().__init__()
         self._jobs: list[BatchJob] = []
@@ -301,54 +309,57 @@ class BatchPanel(QWidget):
 
     def _update_table(self):
         """テーブルを更新"""
+        # 1セルごとの再描画・列幅の再計算（ResizeToContents）を抑え、最後に1回だけ反映
+        self.job_table.setUpdatesEnabled(False)
+        self.job_table.blockSignals(True)
+        try:
+            self._populate_table()
+        finally:
+            self.job_table.blockSignals(False)
+            self.job_table.setUpdatesEnabled(True)
+
+    def _populate_table(self):
+        """テーブルの各セルを設定（既存の行の項目は作り直さずに使い回す）"""
         self.job_table.setRowCount(len(self._jobs))
 
         for row, job in enumerate(self._jobs):
             # ファイル名
-            name_item = QTableWidgetItem(job.pdf_path.name)
+            name_item = self._set_cell(row, 0, job.pdf_path.name)
             name_item.setToolTip(str(job.pdf_path))
-            self.job_table.setItem(row, 0, name_item)
 
             # ステータス
-            status_item = QTableWidgetItem(job.status)
-            status_color = {
-                "待機中": QColor("#6b6b6b"),
-                "処理中": QColor("#2eaadc"),
-                "完了": QColor("#00a86b"),
-                "エラー": QColor("#ff6b6b"),
-            }.get(job.status, QColor("#6b6b6b"))
-            status_item.setForeground(status_color)
-            self.job_table.setItem(row, 1, status_item)
+            status_item = self._set_cell(row, 1, job.status)
+            status_color = self.STATUS_COLORS.get(job.status, self.STATUS_COLORS["待機中"])
+            status_item.setForeground(QColor(status_color))
 
             # 年度
-            year_item = QTableWidgetItem(
-                f"{job.year}年度" if job.year else "-"
-            )
-            self.job_table.setItem(row, 2, year_item)
+            self._set_cell(row, 2, f"{job.year}年度" if job.year else "-")
 
             # クラス
-            class_item = QTableWidgetItem(
-                f"高2英語{job.class_name}" if job.class_name else "-"
-            )
-            self.job_table.setItem(row, 3, class_item)
+            self._set_cell(row, 3, f"高2英語{job.class_name}" if job.class_name else "-")
 
             # 学期
-            term_item = QTableWidgetItem(job.term or "-")
-            self.job_table.setItem(row, 4, term_item)
+            self._set_cell(row, 4, job.term or "-")
 
             # 週
-            week_item = QTableWidgetItem(
-                f"第{job.week}週" if job.week else "-"
-            )
-            self.job_table.setItem(row, 5, week_item)
+            self._set_cell(row, 5, f"第{job.week}週" if job.week else "-")
 
             # 進捗
             if job.page_count > 0:
                 progress_text = f"{job.graded_count}/{job.page_count}"
             else:
                 progress_text = "-"
-            progress_item = QTableWidgetItem(progress_text)
-            self.job_table.setItem(row, 6, progress_item)
+            self._set_cell(row, 6, progress_text)
+
+    def _set_cell(self, row: int, column: int, text: str) -> QTableWidgetItem:
+        """セルの文字列を設定（項目がなければ作成）"""
+        item = self.job_table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            self.job_table.setItem(row, column, item)
+        elif item.text() != text:
+            item.setText(text)
+        return item
 
     def _update_buttons(self):
         """ボタン状態を更新"""
@@ -13,7 +13,8 @@ from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 
 from app.utils.config import Config
 from app.workers.pipeline_worker import PipelineWorker
-from app.utils.additional_answer_manager import AdditionalAnswerManager, AdditionalAnswerItem
+from app.workers.additional_load_worker import AdditionalLoadWorker
+from app.utils.additional_answer_manager import AdditionalAnswerItem
 
 
 class DropArea(QFrame):
@@ -25,62 +26,45 @@ class DropArea(QFrame):
         super().__init__()
         self.setAcceptDrops(True)
         self.setMinimumHeight(150)
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #ccc;
-                border-radius: 12px;
-                background-color: #fafafa;
-            }
-            QFrame:hover {
-                border-color: #2eaadc;
-                background-color: #f0f8ff;
-            }
-        """)
+        self._hovering = False
+        # スタイルは app.qss の QFrame#dropArea で定義
+        self.setObjectName("dropArea")
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         icon_label = QLabel("📄")
-        icon_label.setStyleSheet("font-size: 48px;")
+        icon_label.setObjectName("dropAreaIcon")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon_label)
 
         text_label = QLabel("PDFをドロップ\nまたはクリックして選択")
-        text_label.setStyleSheet("color: #6b6b6b; font-size: 14px;")
+        text_label.setObjectName("dropAreaText")
         text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(text_label)
 
+    def _set_hovering(self, hovering: bool):
+        """ホバー状態を切り替え（状態が変わったときだけスタイルを再適用）"""
+        if hovering == self._hovering:
+            return
+        self._hovering = hovering
+        self.setProperty("hovering", hovering)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    self.setStyleSheet("""
-                        QFrame {
-                            border: 2px solid #2eaadc;
-                            border-radius: 12px;
-                            background-color: #e8f4fc;
-                        }
-                    """)
-                    return
+        mime = event.mimeData()
+        if mime.hasUrls() and any(
+            url.toLocalFile().lower().endswith('.pdf') for url in mime.urls()
+        ):
+            event.acceptProposedAction()
+            self._set_hovering(True)
 
     def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #ccc;
-                border-radius: 12px;
-                background-color: #fafafa;
-            }
-        """)
+        self._set_hovering(False)
 
     def dropEvent(self, event: QDropEvent):
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #ccc;
-                border-radius: 12px;
-                background-color: #fafafa;
-            }
-        """)
+        self._set_hovering(False)
         for url in event.mimeData().urls():
             file_path = url.toLocalFile()
             if file_path.lower().endswith('.pdf'):
@@ -105,23 +89,40 @@ class PdfLoaderPanel(QWidget):
     pdf_loaded = pyqtSignal(str, dict)  # (PDFパス, 検出された情報)
     additional_grading_requested = pyqtSignal(list)  # 追加答案採点リクエスト
 
+    # プロンプトファイルパス -> (更新時刻, 内容)
+    _prompt_cache: dict[str, tuple[float, str]] = {}
+    PROMPT_DISPLAY_LIMIT = 1_048_576  # プロンプト表示の最大文字数
+    # 採点開始ボタンより上に並ぶ遅延生成グループ（表示順）
+    _LAZY_GROUPS = ("info_group", "progress_group", "prompt_group")
+
     def __init__(self):
         super().__init__()
         self._current_pdf_path: str | None = None
         self._pipeline_worker: PipelineWorker | None = None
+        self._additional_load_serial = 0  # 追加答案読み込みの通番（古い結果を捨てるため）
         self._detected_info: dict = {}
         self._additional_items: list[AdditionalAnswerItem] = []
+
+        # 検出情報・プログレス・プロンプト・追加答案は初回使用時に生成する
+        self.info_group: QGroupBox | None = None
+        self.progress_group: QGroupBox | None = None
+        self.prompt_group: QGroupBox | None = None
+        self.additional_group: QGroupBox | None = None
+        self._last_rendered_keys: tuple = ()  # 追加答案リストに表示中の内容
+
         self._setup_ui()
 
     def _setup_ui(self):
-        """UI構築"""
+        """UI構築（スタイルは app.qss の #pdfLoaderPanel 以下で定義）"""
+        self.setObjectName("pdfLoaderPanel")
         layout = QVBoxLayout(self)
+        self._layout = layout
         layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(24)
 
         # タイトル
         title = QLabel("PDF読み込み")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #37352f;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
         # 説明
@@ -129,7 +130,7 @@ class PdfLoaderPanel(QWidget):
             "スキャン済みPDFをドロップまたは選択してください。\n"
             "QRコードから年度・学期・週・クラスを自動判定します。"
         )
-        desc.setStyleSheet("color: #6b6b6b; font-size: 13px;")
+        desc.setObjectName("description")
         layout.addWidget(desc)
 
         # ドロップエリア
@@ -143,22 +144,35 @@ class PdfLoaderPanel(QWidget):
             "既に採点済みの週に、追加提出の答案を読み込む場合にチェックしてください。\n"
             "既存の採点結果を上書きせず、追加答案として処理します。"
         )
-        self.additional_mode_cb.setStyleSheet("""
-            QCheckBox {
-                font-size: 13px;
-                color: #37352f;
-                padding: 4px 0;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        self.additional_mode_cb.setObjectName("additionalModeCheck")
         layout.addWidget(self.additional_mode_cb)
 
+        # 採点開始ボタン
+        self.start_btn = QPushButton("採点画面へ進む →")
+        self.start_btn.setVisible(False)
+        self.start_btn.setObjectName("primaryAction")
+        self.start_btn.clicked.connect(self._on_start_clicked)
+        layout.addWidget(self.start_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        layout.addStretch()
+
+    def _insert_lazy_group(self, name: str, group: QGroupBox):
+        """遅延生成したグループを本来の位置に挿入"""
+        before = self.start_btn
+        for later in self._LAZY_GROUPS[self._LAZY_GROUPS.index(name) + 1:]:
+            widget = getattr(self, later)
+            if widget is not None:
+                before = widget
+                break
+        self._layout.insertWidget(self._layout.indexOf(before), group)
+
+    def _ensure_info_ui(self):
+        """検出情報表示を生成（初回のみ）"""
+        if self.info_group is not None:
+            return
+
         # 検出情報表示
         self.info_group = QGroupBox("検出情報")
-        self.info_group.setVisible(False)
         info_layout = QGridLayout(self.info_group)
 
         self.info_labels = {}
@@ -173,108 +187,69 @@ class PdfLoaderPanel(QWidget):
 
         for key, label_text, row, col in info_items:
             label = QLabel(f"{label_text}:")
-            label.setStyleSheet("font-weight: bold; color: #37352f;")
+            label.setObjectName("infoKey")
             info_layout.addWidget(label, row, col)
 
             value_label = QLabel("-")
-            value_label.setStyleSheet("color: #6b6b6b;")
+            value_label.setObjectName("infoValue")
             self.info_labels[key] = value_label
             info_layout.addWidget(value_label, row, col + 1)
 
-        layout.addWidget(self.info_group)
+        self._insert_lazy_group("info_group", self.info_group)
+
+    def _ensure_progress_ui(self):
+        """プログレス表示を生成（初回のみ）"""
+        if self.progress_group is not None:
+            return
 
         # プログレス
         self.progress_group = QGroupBox("処理中")
-        self.progress_group.setVisible(False)
         progress_layout = QVBoxLayout(self.progress_group)
 
         self.progress_bar = QProgressBar()
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                text-align: center;
-                height: 24px;
-            }
-            QProgressBar::chunk {
-                background-color: #2eaadc;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setObjectName("progressBar")
         progress_layout.addWidget(self.progress_bar)
 
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #6b6b6b;")
+        self.status_label.setObjectName("statusLabel")
         progress_layout.addWidget(self.status_label)
 
-        layout.addWidget(self.progress_group)
+        self._insert_lazy_group("progress_group", self.progress_group)
+
+    def _ensure_prompt_ui(self):
+        """プロンプト表示を生成（初回のみ）"""
+        if self.prompt_group is not None:
+            return
 
         # プロンプト表示
         self.prompt_group = QGroupBox("採点プロンプト")
-        self.prompt_group.setVisible(False)
         prompt_layout = QVBoxLayout(self.prompt_group)
 
         self.prompt_display = QTextEdit()
         self.prompt_display.setReadOnly(True)
         self.prompt_display.setMaximumHeight(200)
-        self.prompt_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #fafafa;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
+        self.prompt_display.setObjectName("promptDisplay")
         prompt_layout.addWidget(self.prompt_display)
 
-        layout.addWidget(self.prompt_group)
+        self._insert_lazy_group("prompt_group", self.prompt_group)
 
-        # 採点開始ボタン
-        self.start_btn = QPushButton("採点画面へ進む →")
-        self.start_btn.setVisible(False)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00a86b;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 14px 32px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #009060; }
-        """)
-        self.start_btn.clicked.connect(self._on_start_clicked)
-        layout.addWidget(self.start_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+    def _ensure_additional_ui(self):
+        """追加答案セクションを生成（初回のみ）"""
+        if self.additional_group is not None:
+            return
 
-        # 追加答案セクション
+        # 追加答案セクション（採点開始ボタンの直後）
         self.additional_group = QGroupBox("追加答案")
-        self.additional_group.setVisible(False)
         additional_layout = QVBoxLayout(self.additional_group)
 
         self.additional_header = QLabel("検出された追加答案はありません")
-        self.additional_header.setStyleSheet("color: #6b6b6b; font-size: 13px;")
+        self.additional_header.setObjectName("additionalHeader")
         additional_layout.addWidget(self.additional_header)
 
         self.additional_list = QListWidget()
         self.additional_list.setMaximumHeight(150)
         self.additional_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.additional_list.setStyleSheet("""
-            QListWidget {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #f0f0f0;
-            }
-            QListWidget::item:selected {
-                background-color: #fff3cd;
-                color: #37352f;
-            }
-        """)
+        self.additional_list.setObjectName("additionalList")
         additional_layout.addWidget(self.additional_list)
 
         # 追加答案のボタン
@@ -285,27 +260,14 @@ class PdfLoaderPanel(QWidget):
         additional_btn_layout.addWidget(self.select_all_btn)
 
         self.grade_additional_btn = QPushButton("選択した答案を採点")
-        self.grade_additional_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f0ad4e;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #ec971f; }
-            QPushButton:disabled { background-color: #ccc; }
-        """)
+        self.grade_additional_btn.setObjectName("gradeAdditional")
         self.grade_additional_btn.clicked.connect(self._on_grade_additional)
         additional_btn_layout.addWidget(self.grade_additional_btn)
 
         additional_btn_layout.addStretch()
         additional_layout.addLayout(additional_btn_layout)
 
-        layout.addWidget(self.additional_group)
-
-        layout.addStretch()
+        self._layout.insertWidget(self._layout.indexOf(self.start_btn) + 1, self.additional_group)
 
     def _on_file_selected(self, file_path: str):
         """ファイル選択時"""
@@ -320,16 +282,19 @@ class PdfLoaderPanel(QWidget):
         # UI更新
         self.drop_area.setVisible(False)
         self.additional_mode_cb.setVisible(False)
-        self.info_group.setVisible(False)
-        self.prompt_group.setVisible(False)
         self.start_btn.setVisible(False)
-        self.additional_group.setVisible(False)
+        for group in (self.info_group, self.prompt_group, self.additional_group):
+            if group is not None:
+                group.setVisible(False)
+        self._ensure_progress_ui()
         self.progress_group.setVisible(True)
         self.progress_bar.setValue(0)
         self.status_label.setText("処理開始...")
 
-        # 追加答案リストをクリア
+        # 追加答案リストをクリア（読み込み中の保存済み追加答案は破棄）
         self._additional_items = []
+        self._additional_load_serial += 1
+        self._last_rendered_keys = ()
 
         # ワーカー開始（追加答案モードフラグを渡す）
         is_additional = self.additional_mode_cb.isChecked()
@@ -353,14 +318,13 @@ class PdfLoaderPanel(QWidget):
     def _on_students_found(self, students: list):
         """生徒情報検出"""
         if students:
-            # 枚数が最も多い週を検出情報として使用
-            from collections import Counter
-            week_counts = Counter(
-                (s.get("year"), s.get("term"), s.get("week"), s.get("class_name"))
-                for s in students
-            )
-            most_common = week_counts.most_common(1)[0][0]
-            year, term, week, class_name = most_common
+            # 枚数が最も多い週を検出情報として使用（ソートせず最大値を取る）
+            counts: dict[tuple, int] = {}
+            for s in students:
+                key = (s.get("year"), s.get("term"), s.get("week"), s.get("class_name"))
+                counts[key] = counts.get(key, 0) + 1
+            # 同数の場合は先に出現したものを優先（Counter.most_common と同じ）
+            year, term, week, class_name = max(counts, key=counts.get)
 
             self._detected_info = {
                 "year": year,
@@ -379,6 +343,7 @@ class PdfLoaderPanel(QWidget):
         self.progress_group.setVisible(False)
         self.drop_area.setVisible(True)
         self.additional_mode_cb.setVisible(True)
+        self._ensure_info_ui()
         self.info_group.setVisible(True)
 
         # 検出情報を表示
@@ -404,6 +369,7 @@ class PdfLoaderPanel(QWidget):
             self.info_labels["pages"].setText(f"{page_count}ページ")
 
             # プロンプト読み込み
+            self._ensure_prompt_ui()
             self._load_prompt()
 
             self.prompt_group.setVisible(True)
@@ -466,8 +432,19 @@ class PdfLoaderPanel(QWidget):
         prompt_file = week_path / "prompt.txt"
 
         if prompt_file.exists():
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                self.prompt_display.setText(f.read())
+            key = str(prompt_file)
+            mtime = prompt_file.stat().st_mtime
+            cached = self._prompt_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                text = cached[1]
+            else:
+                # 誤って巨大なファイルを指定してもUIが固まらないよう上限まで読む
+                with open(prompt_file, "r", encoding="utf-8") as f:
+                    text = f.read(self.PROMPT_DISPLAY_LIMIT + 1)
+                if len(text) > self.PROMPT_DISPLAY_LIMIT:
+                    text = text[:self.PROMPT_DISPLAY_LIMIT] + "\n…（以下省略）"
+                self._prompt_cache[key] = (mtime, text)
+            self.prompt_display.setText(text)
         else:
             self.prompt_display.setText(
                 f"プロンプトファイルが見つかりません:\n{prompt_file}\n\n"
@@ -484,20 +461,26 @@ class PdfLoaderPanel(QWidget):
         self._current_pdf_path = None
         self._detected_info = {}
         self._additional_items = []
+        self._additional_load_serial += 1  # 読み込み中の保存済み追加答案は破棄
 
         self.drop_area.setVisible(True)
         self.additional_mode_cb.setVisible(True)
         self.additional_mode_cb.setChecked(False)
-        self.info_group.setVisible(False)
-        self.prompt_group.setVisible(False)
-        self.progress_group.setVisible(False)
         self.start_btn.setVisible(False)
-        self.additional_group.setVisible(False)
+        for group in (
+            self.info_group, self.prompt_group,
+            self.progress_group, self.additional_group
+        ):
+            if group is not None:
+                group.setVisible(False)
 
-        for label in self.info_labels.values():
-            label.setText("-")
+        if self.info_group is not None:
+            for label in self.info_labels.values():
+                label.setText("-")
 
-        self.additional_list.clear()
+        if self.additional_group is not None:
+            self.additional_list.clear()
+        self._last_rendered_keys = ()
 
     def open_pdf_dialog(self):
         """PDFファイル選択ダイアログを開く"""
@@ -514,40 +497,62 @@ class PdfLoaderPanel(QWidget):
         """追加答案検出時"""
         if self._pipeline_worker:
             self._additional_items = self._pipeline_worker.additional_items
+            self._additional_load_serial += 1  # パイプラインの結果を優先
+        # 表示中の内容から変化がなければリストを再構築しない
+        if self._additional_keys(self._additional_items) == self._last_rendered_keys:
+            return
         self._update_additional_list()
 
+    @staticmethod
+    def _additional_keys(items: list[AdditionalAnswerItem]) -> tuple:
+        """追加答案リストの同一性判定用キー"""
+        return tuple(
+            (item.filename, item.attendance_no, item.target_week) for item in items
+        )
+
     def _update_additional_list(self):
         """追加答案リストを更新"""
-        self.additional_list.clear()
-
+        self._last_rendered_keys = self._additional_keys(self._additional_items)
         if not self._additional_items:
-            self.additional_group.setVisible(False)
+            if self.additional_group is not None:
+                self.additional_list.clear()
+                self.additional_group.setVisible(False)
             return
 
+        self._ensure_additional_ui()
+        self.additional_list.clear()
         self.additional_group.setVisible(True)
         self.additional_header.setText(
             f"異なる週の答案が {len(self._additional_items)} 件検出されました"
         )
 
+        list_items = []
         for item in self._additional_items:
             text = f"第{item.target_week:02d}週 - {item.student_name} (出席番号{item.attendance_no})"
             list_item = QListWidgetItem(text)
             list_item.setData(Qt.ItemDataRole.UserRole, item)
-            self.additional_list.addItem(list_item)
+            list_items.append(list_item)
+
+        # 一括追加（1件ごとの再描画・シグナル発火を抑制）
+        self.additional_list.setUpdatesEnabled(False)
+        self.additional_list.blockSignals(True)
+        try:
+            for list_item in list_items:
+                self.additional_list.addItem(list_item)
+        finally:
+            self.additional_list.blockSignals(False)
+            self.additional_list.setUpdatesEnabled(True)
 
     def _select_all_additional(self):
         """すべての追加答案を選択"""
-        for i in range(self.additional_list.count()):
-            self.additional_list.item(i).setSelected(True)
+        self.additional_list.selectAll()
 
     def _on_grade_additional(self):
         """選択した追加答案を採点"""
-        selected_items = []
-        for i in range(self.additional_list.count()):
-            item = self.additional_list.item(i)
-            if item.isSelected():
-                additional_item = item.data(Qt.ItemDataRole.UserRole)
-                selected_items.append(additional_item)
+        selected_items = [
+            item.data(Qt.ItemDataRole.UserRole)
+            for item in self.additional_list.selectedItems()
+        ]
 
         if not selected_items:
             QMessageBox.information(self, "追加答案", "採点する答案を選択してください")
@@ -556,31 +561,35 @@ class PdfLoaderPanel(QWidget):
         self.additional_grading_requested.emit(selected_items)
 
     def load_additional_answers(self):
-        """保存済みの追加答案を読み込み"""
+        """保存済みの追加答案を読み込み（ディレクトリ走査はワーカースレッドで実行）"""
         current = Config.get_current_week()
         if not current:
             return
 
-        try:
-            year_dir = Config.APP_DATA_DIR / f"{current.get('year')}年度"
-            all_items = AdditionalAnswerManager.list_all_additional_answers(year_dir)
-
-            # AdditionalAnswerItem に変換
-            self._additional_items = []
-            for item_data in all_items:
-                if not item_data.get("graded", False):
-                    item = AdditionalAnswerItem(
-                        filename=item_data["filename"],
-                        student_name=item_data["student_name"],
-                        attendance_no=item_data["attendance_no"],
-                        class_name=item_data.get("class_name", ""),
-                        target_week=item_data["target_week"],
-                        target_term=item_data["target_term"],
-                        qr_data=item_data.get("qr_data", ""),
-                        graded=item_data.get("graded", False),
-                    )
-                    self._additional_items.append(item)
-
-            self._update_additional_list()
-        except Exception:
-            pass
+        # 走査中でも読み直す（前のワーカーの結果は通番で破棄）。
+        # ワーカーはパネルが所有し、終了後に破棄する
+        self._additional_load_serial += 1
+        year_dir = Config.APP_DATA_DIR / f"{current.get('year')}年度"
+        worker = AdditionalLoadWorker(year_dir, self._additional_load_serial, self)
+        worker.loaded.connect(self._on_additional_loaded)
+        worker.error.connect(self._on_additional_load_error)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_additional_loaded(self, serial: int, items: list):
+        """保存済み追加答案の読み込み完了"""
+        if serial != self._additional_load_serial:
+            return  # 後から読み直している、またはリセット・処理開始済み
+
+        self._additional_items = items
+        self._update_additional_list()
+
+    def _on_additional_load_error(self, serial: int, error: str):
+        """保存済み追加答案の読み込みエラー"""
+        if serial != self._additional_load_serial:
+            return
+
+        QMessageBox.warning(
+            self, "追加答案",
+            f"保存済みの追加答案を読み込めませんでした:\n{error}"
+        )
@@ -1,13 +1,14 @@
 """PDFプレビューウィジェット"""
 
 from __future__ import annotations
+import threading
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QScrollArea, QPushButton, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QSize
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
 
 try:
     import fitz  # PyMuPDF
@@ -15,17 +16,161 @@ try:
 except ImportError:
     HAS_PYMUPDF = False
 
+# MuPDFはスレッドセーフではなく、ストア（デコード済みリソースのキャッシュ）もプロセスで1つ。
+# ウィジェットが複数あっても、ドキュメント操作・ストア操作はすべてこのロックで直列化する
+_MUPDF_LOCK = threading.Lock()
+
+
+class _RenderSignals(QObject):
+    """PageRenderTask のシグナル（QRunnable は QObject ではないため分離）"""
+
+    finished = pyqtSignal(int, int, float, QImage)  # トークン, ページ番号, ズーム, レンダリング結果
+    error = pyqtSignal(int, int, float, str)  # トークン, ページ番号, ズーム, エラーメッセージ
+
+
+class PageRenderTask(QRunnable):
+    """PDFページをワーカースレッドでラスタライズするタスク
+
+    MuPDFはスレッドセーフではないため、
+    ドキュメントへのアクセスは _MUPDF_LOCK で直列化する。
+    """
+
+    def __init__(
+        self, doc, page_index: int,
+        zoom: float, matrix, token: int
+    ):
+        super().__init__()
+        self.signals = _RenderSignals()
+        self._doc = doc
+        self._page_index = page_index
+        self._zoom = zoom
+        self._matrix = matrix  # fitz.Matrix（ズーム × ラスタライズ倍率）
+        self._token = token
+
+    def run(self):
+        """レンダリング実行"""
+        try:
+            with _MUPDF_LOCK:
+                page = self._doc[self._page_index]
+                # RGB・alpha=False を明示し、常に3バイト/ピクセルで受け取る
+                # （CMYK・グレースケールのページでも Format_RGB888 のまま扱える）
+                pix = page.get_pixmap(matrix=self._matrix, colorspace=fitz.csRGB, alpha=False)
+
+                # pix.samples_mv はMuPDFのバッファを直接参照する（bytesへのコピーなし）。
+                # pix の解放後も使えるよう、Qt側のバッファへの1回のコピーで切り離す
+                image = QImage(
+                    pix.samples_mv, pix.width, pix.height, pix.stride,
+                    QImage.Format.Format_RGB888
+                ).copy()
+        except Exception as e:
+            self.signals.error.emit(self._token, self._page_index, self._zoom, str(e))
+            return
+
+        self.signals.finished.emit(self._token, self._page_index, self._zoom, image)
+
+
+class _ImageLoadSignals(QObject):
+    """ImageLoadTask のシグナル"""
+
+    finished = pyqtSignal(int, int, float, QImage)  # トークン, 画像番号, ズーム, デコード済み画像
+    error = pyqtSignal(int, int, str)  # トークン, 画像番号, エラーメッセージ
+
+
+class ImageLoadTask(QRunnable):
+    """画像ファイルをワーカースレッドでデコードするタスク
+
+    QImageReader に縮小後のサイズを渡し、デコード時に縮小させる
+    （JPEGはDCT段階で縮小されるため、原寸の画像をメモリに展開しない）。
+    """
+
+    def __init__(self, path: Path, index: int, zoom: float, token: int):
+        super().__init__()
+        self.signals = _ImageLoadSignals()
+        self._path = path
+        self._index = index
+        self._zoom = zoom
+        self._token = token
+
+    def run(self):
+        """デコード実行"""
+        reader = QImageReader(str(self._path))
+        size = reader.size()  # ヘッダのみ読んで原寸を取得
+        if size.isValid():
+            reader.setScaledSize(QSize(
+                max(1, int(size.width() * self._zoom)),
+                max(1, int(size.height() * self._zoom))
+            ))
+
+        image = reader.read()
+        if image.isNull():
+            self.signals.error.emit(self._token, self._index, reader.errorString())
+            return
+
+        self.signals.finished.emit(self._token, self._index, self._zoom, image)
+
 
 class PDFPreviewWidget(QWidget):
     """PDFプレビューウィジェット"""
 
     page_changed = pyqtSignal(int)  # ページ番号（1始まり）
 
+    PIXMAP_CACHE_BYTES = 256 * 1024 * 1024  # QPixmapCache に確保する容量（256MB）
+    FULL_TIER = "full"  # 高解像度版のキャッシュ区分
+    THUMB_TIER = "thumb"  # 低解像度版（先読み・初回表示用）のキャッシュ区分
+    PREFETCH_PRIORITY = -1  # 先読みは表示用レンダリングより後回し
+    PREVIEW_SCALE = 0.5  # 初回表示用の低解像度レンダリング倍率（高解像度版に対する比）
+    HIRES_DELAY_MS = 150  # 操作が止まってから高解像度に差し替えるまでの時間
+    RENDER_DEBOUNCE_MS = 100  # 連続したズーム・ページ指定操作をまとめる時間
+    PRERENDER_MAX_PAGES = 20  # このページ数以下のPDFは読み込み時に全ページを描画しておく
+
     def __init__(self):
         super().__init__()
         self._pdf_doc = None
+        self._page_count = 0  # PDFの総ページ数（load_pdf 時に確定）
         self._current_page = 0
         self._zoom = 1.0
+        self._image_paths: list[Path] = []  # 画像モードで表示する画像（PDF表示中は使わない）
+        # レンダリング結果はQt全体で共有される QPixmapCache に置く（LRU・容量はQtが管理）。
+        # 閉じたドキュメントの分を削除できるよう、登録したキーを覚えておく
+        limit_kb = self.PIXMAP_CACHE_BYTES // 1024
+        if QPixmapCache.cacheLimit() < limit_kb:
+            QPixmapCache.setCacheLimit(limit_kb)
+        self._page_cache_keys: set[str] = set()
+        self._image_cache_keys: set[str] = set()
+        # バックグラウンドレンダリング用
+        self._render_token = 0  # 最新のレンダリング要求（古い結果は破棄）
+        self._doc_serial = 0  # ドキュメント切り替えごとに増加（先読み結果の破棄用）
+        self._inflight: set[tuple[int, float]] = set()  # 先読み中のキー
+        self._prefetch_tasks: dict[tuple[int, float], PageRenderTask] = {}  # 未完了の先読みタスク
+        # 開始したレンダリングタスク（autoDelete を切り、結果が届くまでこちらで保持する。
+        # Qt に破棄させると、完了直後のタスクを tryTake したときに削除済みラッパーを渡してしまう）
+        self._live_tasks: dict[_RenderSignals, PageRenderTask] = {}
+        # 全ページの事前レンダリング（1ページずつ順に実行）
+        self._prerender_queue: list[int] = []
+        self._prerender_zoom = 1.0
+        self._prerender_task: PageRenderTask | None = None
+        self._prerender_bytes = 0  # 事前レンダリングで追加したメモリ量
+        self._prerender_page_bytes = 0  # 直前に描画したページのメモリ量（上限判定用）
+        # 表示用に描画中のページ（同じページへの重複要求をまとめる）
+        self._visible_key: tuple[int, float] | None = None
+        self._visible_task: PageRenderTask | None = None
+        # ズーム操作中の簡易プレビュー用
+        self._shown_zoom = 1.0  # 表示中の画像をレンダリングしたズーム
+        self._zoom_base: tuple[QPixmap, float] | None = None  # 簡易拡大縮小の元画像
+        self._matrix_cache: dict[float, fitz.Matrix] = {}  # 倍率 -> fitz.Matrix
+
+        # 低解像度で即時表示した後、操作が落ち着いたら高解像度で描き直す
+        self._hires_timer = QTimer(self)
+        self._hires_timer.setSingleShot(True)
+        self._hires_timer.setInterval(self.HIRES_DELAY_MS)
+        self._hires_timer.timeout.connect(self._render_hires)
+
+        # 連続したズーム・スピンボックス操作は最後の1回だけレンダリングする
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_DEBOUNCE_MS)
+        self._render_timer.timeout.connect(self._render_current)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -96,38 +241,352 @@ class PDFPreviewWidget(QWidget):
             self.image_label.setText("PyMuPDFがインストールされていません\npip install PyMuPDF")
             return
 
+        # 前のドキュメントを閉じてファイルハンドルとMuPDFのメモリを解放
+        self._close_document()
+
         try:
-            self._pdf_doc = fitz.open(pdf_path)
+            with _MUPDF_LOCK:
+                self._pdf_doc = fitz.open(pdf_path)
+            self._page_count = len(self._pdf_doc)
             self._current_page = 0
-            self.page_spin.setMaximum(len(self._pdf_doc))
+            self.page_spin.setMaximum(self._page_count)
             self.page_spin.setValue(1)
-            self.page_label.setText(f"/ {len(self._pdf_doc)}")
+            self.page_label.setText(f"/ {self._page_count}")
+            self._render_timer.stop()
             self._render_page()
         except Exception as e:
+            self._page_count = 0
             self.image_label.setText(f"PDF読み込みエラー:\n{e}")
+            return
+
+        if self._page_count <= self.PRERENDER_MAX_PAGES:
+            # 表示中のページは通常の経路で描画されるので最後に回す
+            self._prerender_queue = list(range(1, self._page_count)) + [0]
+            self._prerender_zoom = self._zoom
+            self._prerender_next()
 
     def _render_page(self):
-        """現在ページをレンダリング"""
+        """現在ページをレンダリング
+
+        キャッシュがなければワーカースレッドでまず低解像度で描画し、
+        操作が止まったら高解像度版に差し替える。
+        """
         if not self._pdf_doc:
             return
 
-        page = self._pdf_doc[self._current_page]
-        mat = fitz.Matrix(self._zoom * 2, self._zoom * 2)  # 2x for retina
-        pix = page.get_pixmap(matrix=mat)
-
-        # QImageに変換
-        img = QImage(
-            pix.samples,
-            pix.width,
-            pix.height,
-            pix.stride,
-            QImage.Format.Format_RGB888 if pix.n == 3 else QImage.Format.Format_RGBA8888
-        )
+        self._cancel_stale_prefetches()
 
-        pixmap = QPixmap.fromImage(img)
-        self.image_label.setPixmap(pixmap)
+        key = self._cache_key(self._current_page, self._zoom)
+        pixmap = self._find_pixmap(key)
+        if pixmap is not None:
+            self._render_token += 1  # 実行中のレンダリング結果は表示しない
+            self._cancel_visible_render()
+            self._show_pixmap(pixmap, self._zoom)
+            self._update_buttons()
+            self._prefetch_adjacent()
+            return
+
+        if key == self._visible_key:
+            # 同じページを描画中（スピンボックスとボタンからの二重要求など）
+            self._update_buttons()
+            return
+
+        self._render_token += 1
+        self._cancel_visible_render()
+
+        thumb = self._find_pixmap(key, self.THUMB_TIER)
+        if thumb is not None:
+            # 先読み済みの低解像度版を表示し、高解像度版は操作が止まってから描画
+            self._show_pixmap(thumb, self._zoom)
+            self._hires_timer.start()
+            self._update_buttons()
+            self._prefetch_adjacent()
+            return
+
+        if key in self._inflight:
+            # 先読み中のページは完了時に表示する
+            self._hires_timer.start()
+            self._update_buttons()
+            return
+
+        task = PageRenderTask(
+            self._pdf_doc, self._current_page, self._zoom,
+            self._get_matrix(self._zoom * self._render_scale() * self.PREVIEW_SCALE), self._render_token
+        )
+        task.signals.finished.connect(self._on_preview_rendered)
+        task.signals.error.connect(self._on_render_error)
+        self._visible_key = key
+        self._visible_task = task
+        self._start_render_task(task)
+        self._hires_timer.start()
         self._update_buttons()
 
+    def _start_render_task(self, task: PageRenderTask, priority: int = 0):
+        """レンダリングタスクを開始（結果のシグナルが届くまで保持）"""
+        task.setAutoDelete(False)
+        self._live_tasks[task.signals] = task
+        QThreadPool.globalInstance().start(task, priority)
+
+    def _take_render_task(self, task: PageRenderTask) -> bool:
+        """未実行のレンダリングタスクを取り消す（実行中・完了済みなら False）"""
+        if not QThreadPool.globalInstance().tryTake(task):
+            return False
+        self._live_tasks.pop(task.signals, None)
+        return True
+
+    def _release_render_task(self):
+        """結果を受け取ったタスクの保持を解除（スロットの先頭で呼ぶ）"""
+        self._live_tasks.pop(self.sender(), None)
+
+    def _cancel_visible_render(self):
+        """未実行の表示用レンダリングを取り消す"""
+        if self._visible_task is not None:
+            self._take_render_task(self._visible_task)
+        self._visible_task = None
+        self._visible_key = None
+
+    def _render_hires(self):
+        """現在ページを高解像度でレンダリング（デバウンス後）"""
+        if not self._pdf_doc or self._is_image_mode():
+            return
+
+        key = self._cache_key(self._current_page, self._zoom)
+        if self._find_pixmap(key) is not None:
+            # 事前レンダリング済み（完了した低解像度タスクの参照を残さない）
+            self._visible_task = None
+            self._visible_key = None
+            return
+
+        task = PageRenderTask(
+            self._pdf_doc, self._current_page, self._zoom,
+            self._get_matrix(self._zoom * self._render_scale()), self._render_token
+        )
+        task.signals.finished.connect(self._on_page_rendered)
+        task.signals.error.connect(self._on_render_error)
+        self._visible_key = key
+        self._visible_task = task
+        self._start_render_task(task)
+
+    def _on_preview_rendered(self, token: int, page_index: int, zoom: float, image: QImage):
+        """低解像度レンダリング完了（GUIスレッド）"""
+        self._release_render_task()
+        if token != self._render_token:
+            return  # 古い要求の結果は破棄
+        if self._visible_task is not None and self.sender() is self._visible_task.signals:
+            # 完了したタスクの参照を残さない（高解像度タスクが始まっていればそちらを残す）
+            self._visible_task = None
+            self._visible_key = None
+        key = self._cache_key(page_index, zoom)
+        pixmap = self._preview_pixmap(image)
+        self._cache_pixmap(key, pixmap, self.THUMB_TIER)
+        if self._find_pixmap(key) is not None:
+            return  # 高解像度版が先に届いている
+        if key != self._cache_key(self._current_page, self._zoom):
+            return  # 要求後にページ・ズームが変わった
+
+        self._show_pixmap(pixmap, zoom)
+
+    def _on_page_rendered(self, token: int, page_index: int, zoom: float, image: QImage):
+        """高解像度レンダリング完了（GUIスレッド）"""
+        self._release_render_task()
+        if token != self._render_token:
+            return  # 古い要求の結果は破棄
+
+        self._visible_task = None
+        self._visible_key = None
+        pixmap = self._page_pixmap(image)
+        key = self._cache_key(page_index, zoom)
+        self._cache_pixmap(key, pixmap)
+        if key != self._cache_key(self._current_page, self._zoom):
+            return  # 要求後にページ・ズームが変わった
+        self._show_pixmap(pixmap, zoom)
+        self._prefetch_adjacent()
+
+    def _on_render_error(self, token: int, page_index: int, zoom: float, error: str):
+        """レンダリングエラー"""
+        self._release_render_task()
+        if token == self._render_token:
+            self._visible_task = None
+            self._visible_key = None
+            self.image_label.setText(f"PDF描画エラー:\n{error}")
+
+    def _prefetch_adjacent(self):
+        """前後のページをバックグラウンドで先読み
+
+        先読みは低解像度で行い（メモリ1/4）、高解像度はそのページを表示したときに描画する。
+        """
+        if not self._pdf_doc:
+            return
+
+        page_count = self._page_count
+        for page_index in (self._current_page + 1, self._current_page - 1):
+            if not 0 <= page_index < page_count:
+                continue
+            key = self._cache_key(page_index, self._zoom)
+            if key in self._inflight:
+                continue
+            if self._find_pixmap(key) is not None or self._find_pixmap(key, self.THUMB_TIER) is not None:
+                continue
+
+            self._inflight.add(key)
+            task = PageRenderTask(
+                self._pdf_doc, page_index, self._zoom,
+                self._get_matrix(self._zoom * self._render_scale() * self.PREVIEW_SCALE), self._doc_serial
+            )
+            task.signals.finished.connect(self._on_prefetch_rendered)
+            task.signals.error.connect(self._on_prefetch_error)
+            self._prefetch_tasks[key] = task
+            self._start_render_task(task, self.PREFETCH_PRIORITY)
+
+    def _cancel_stale_prefetches(self):
+        """現在ページの前後以外を対象とした未実行の先読みを取り消す"""
+        wanted = {
+            self._cache_key(self._current_page + offset, self._zoom)
+            for offset in (-1, 0, 1)
+        }
+        for key, task in list(self._prefetch_tasks.items()):
+            if key not in wanted and self._take_render_task(task):
+                del self._prefetch_tasks[key]
+                self._inflight.discard(key)
+
+    def _on_prefetch_rendered(self, serial: int, page_index: int, zoom: float, image: QImage):
+        """先読み完了（キャッシュに格納するのみ。表示待ちのページなら表示）"""
+        self._release_render_task()
+        if serial != self._doc_serial:
+            return
+
+        key = self._cache_key(page_index, zoom)
+        self._inflight.discard(key)
+        self._prefetch_tasks.pop(key, None)
+        pixmap = self._preview_pixmap(image)
+        self._cache_pixmap(key, pixmap, self.THUMB_TIER)
+
+        if (
+            key == self._cache_key(self._current_page, self._zoom)
+            and self._find_pixmap(key) is None
+            and not self._is_image_mode()
+        ):
+            self._show_pixmap(pixmap, zoom)
+            self._prefetch_adjacent()
+
+    def _on_prefetch_error(self, serial: int, page_index: int, zoom: float, error: str):
+        """先読みエラー"""
+        self._release_render_task()
+        if serial != self._doc_serial:
+            return
+
+        key = self._cache_key(page_index, zoom)
+        self._inflight.discard(key)
+        self._prefetch_tasks.pop(key, None)
+        if key == self._cache_key(self._current_page, self._zoom) and not self._is_image_mode():
+            self.image_label.setText(f"PDF描画エラー:\n{error}")
+
+    def _prerender_next(self):
+        """事前レンダリングの次のページをバックグラウンドで描画"""
+        if self._prerender_task is not None or not self._pdf_doc:
+            return
+
+        while self._prerender_queue:
+            if self._zoom != self._prerender_zoom:
+                self._prerender_queue.clear()  # ズームが変わったら打ち切る
+                return
+            if self._prerender_bytes + self._prerender_page_bytes > QPixmapCache.cacheLimit() * 1024:
+                self._prerender_queue.clear()  # キャッシュの上限に達したら打ち切る
+                return
+
+            page_index = self._prerender_queue.pop(0)
+            if self._find_pixmap(self._cache_key(page_index, self._zoom)) is not None:
+                continue
+
+            task = PageRenderTask(
+                self._pdf_doc, page_index, self._zoom,
+                self._get_matrix(self._zoom * self._render_scale()), self._doc_serial
+            )
+            task.signals.finished.connect(self._on_prerendered)
+            task.signals.error.connect(self._on_prerender_error)
+            self._prerender_task = task
+            self._start_render_task(task, self.PREFETCH_PRIORITY - 1)
+            return
+
+    def _on_prerendered(self, serial: int, page_index: int, zoom: float, image: QImage):
+        """事前レンダリング完了"""
+        self._release_render_task()
+        if serial != self._doc_serial:
+            return
+
+        self._prerender_task = None
+        key = self._cache_key(page_index, zoom)
+        pixmap = self._page_pixmap(image)
+        self._prerender_page_bytes = self._pixmap_bytes(pixmap)
+        self._prerender_bytes += self._prerender_page_bytes
+        self._cache_pixmap(key, pixmap)
+
+        if key == self._cache_key(self._current_page, self._zoom) and not self._is_image_mode():
+            self._show_pixmap(pixmap, zoom)
+        self._prerender_next()
+
+    def _on_prerender_error(self, serial: int, page_index: int, zoom: float, error: str):
+        """事前レンダリングエラー（そのページは表示時に描画する）"""
+        self._release_render_task()
+        if serial != self._doc_serial:
+            return
+
+        self._prerender_task = None
+        self._prerender_next()
+
+    def _get_matrix(self, factor: float):
+        """倍率に対応する fitz.Matrix を取得（ズーム段階は少数なのでメモ化）"""
+        factor = round(factor, 3)
+        mat = self._matrix_cache.get(factor)
+        if mat is None:
+            mat = self._matrix_cache[factor] = fitz.Matrix(factor, factor)
+        return mat
+
+    def _render_scale(self) -> float:
+        """ラスタライズ倍率（画面のデバイスピクセル比。Retinaでは2、通常は1）"""
+        return self.devicePixelRatioF()
+
+    def _page_pixmap(self, image: QImage) -> QPixmap:
+        """高解像度のレンダリング結果をQPixmapに変換（表示サイズはズーム倍率どおり）"""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self._render_scale())
+        return pixmap
+
+    def _preview_pixmap(self, image: QImage) -> QPixmap:
+        """低解像度のレンダリング結果を高解像度版と同じ表示サイズのQPixmapに変換"""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self._render_scale() * self.PREVIEW_SCALE)
+        return pixmap
+
+    @staticmethod
+    def _cache_key(page_index: int, zoom: float) -> tuple[int, float]:
+        """ピクスマップキャッシュのキー"""
+        return (page_index, round(zoom, 3))
+
+    def _pixmap_cache_key(self, key: tuple[int, float], tier: str) -> str:
+        """QPixmapCache のキー（ドキュメント・解像度ごとに区別）"""
+        page_index, zoom = key
+        # 別の倍率の画面に移動したら描き直すよう、デバイスピクセル比も含める
+        return f"pdf:{id(self)}:{self._doc_serial}:{tier}@{self._render_scale()}:{page_index}:{zoom}"
+
+    def _find_pixmap(self, key: tuple[int, float], tier: str = FULL_TIER) -> QPixmap | None:
+        """キャッシュ済みのページを取得（なければ None）"""
+        pixmap = QPixmapCache.find(self._pixmap_cache_key(key, tier))
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    def _cache_pixmap(self, key: tuple[int, float], pixmap: QPixmap, tier: str = FULL_TIER):
+        """ページをキャッシュに追加（容量を超えたらQtが古いものから削除）"""
+        cache_key = self._pixmap_cache_key(key, tier)
+        if QPixmapCache.insert(cache_key, pixmap):
+            self._page_cache_keys.add(cache_key)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        """ピクスマップのおおよそのメモリ使用量"""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
     def _update_buttons(self):
         """ボタン状態更新"""
         page_count = self._get_page_count()
@@ -140,20 +599,21 @@ class PDFPreviewWidget(QWidget):
     def _get_page_count(self) -> int:
         """総ページ数を取得"""
         if self._pdf_doc:
-            return len(self._pdf_doc)
-        if hasattr(self, '_image_paths') and self._image_paths:
+            return self._page_count
+        if self._image_paths:
             return len(self._image_paths)
         return 0
 
     def _is_image_mode(self) -> bool:
         """画像モードかどうか"""
-        return self._pdf_doc is None and hasattr(self, '_image_paths') and self._image_paths
+        return self._pdf_doc is None and bool(self._image_paths)
 
     def _prev_page(self):
         """前ページ"""
         if self._current_page > 0:
             self._current_page -= 1
             self.page_spin.setValue(self._current_page + 1)
+            self._render_timer.stop()  # ボタン操作は即時レンダリング
             self._render_current()
 
     def _next_page(self):
@@ -162,14 +622,16 @@ class PDFPreviewWidget(QWidget):
         if self._current_page < page_count - 1:
             self._current_page += 1
             self.page_spin.setValue(self._current_page + 1)
+            self._render_timer.stop()  # ボタン操作は即時レンダリング
             self._render_current()
 
     def _goto_page(self, page_num: int):
-        """指定ページへ（スピンボックスから）"""
+        """指定ページへ（スピンボックスから。連続変更はまとめてレンダリング）"""
         page_count = self._get_page_count()
         if 1 <= page_num <= page_count:
             self._current_page = page_num - 1
-            self._render_current()
+            self._update_buttons()
+            self._render_timer.start()
             self.page_changed.emit(page_num)
 
     def set_page(self, page_num: int):
@@ -193,17 +655,49 @@ class PDFPreviewWidget(QWidget):
         """ズームイン"""
         if self._zoom < 3.0:
             self._zoom += 0.25
-            self._render_current()
+            self._schedule_zoom_render()
 
     def _zoom_out(self):
         """ズームアウト"""
         if self._zoom > 0.25:
             self._zoom -= 0.25
-            self._render_current()
+            self._schedule_zoom_render()
+
+    def _schedule_zoom_render(self):
+        """ズーム表示を即時更新し、レンダリングはデバウンスする"""
+        self.zoom_label.setText(f"{int(self._zoom * 100)}%")
+        self._show_zoom_preview()
+        self._render_timer.start()
+
+    def _show_zoom_preview(self):
+        """確定レンダリングまでの間、表示中の画像を高速に拡大縮小して表示"""
+        if self._zoom_base is None:
+            pixmap = self.image_label.pixmap()
+            if pixmap is None or pixmap.isNull():
+                return
+            self._zoom_base = (pixmap, self._shown_zoom)
+
+        base, base_zoom = self._zoom_base
+        ratio = self._zoom / base_zoom
+        scaled = base.scaled(
+            int(base.width() * ratio),
+            int(base.height() * ratio),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
+        scaled.setDevicePixelRatio(base.devicePixelRatio())
+        self.image_label.setPixmap(scaled)
+
+    def _show_pixmap(self, pixmap: QPixmap, zoom: float):
+        """レンダリング済みの画像を表示"""
+        self.image_label.setPixmap(pixmap)
+        self._shown_zoom = zoom
+        self._zoom_base = None
 
     def load_images(self, image_paths: list):
         """複数画像を読み込み（croppedフォルダ用）"""
-        self._pdf_doc = None
+        self._close_document()
+        self._clear_image_cache()  # 切り抜き直しでファイルが更新されている可能性がある
         self._image_paths = [Path(p) for p in image_paths]
         self._current_page = 0
 
@@ -214,6 +708,7 @@ class PDFPreviewWidget(QWidget):
         self.page_spin.setMaximum(len(self._image_paths))
         self.page_spin.setValue(1)
         self.page_label.setText(f"/ {len(self._image_paths)}")
+        self._render_timer.stop()
         self._render_image()
 
     def load_image(self, image_path: str):
@@ -222,7 +717,7 @@ class PDFPreviewWidget(QWidget):
 
     def _render_image(self):
         """現在の画像をレンダリング"""
-        if not hasattr(self, '_image_paths') or not self._image_paths:
+        if not self._image_paths:
             return
 
         if self._current_page >= len(self._image_paths):
@@ -233,23 +728,101 @@ class PDFPreviewWidget(QWidget):
             self.image_label.setText(f"画像が見つかりません:\n{path}")
             return
 
-        pixmap = QPixmap(str(path))
-        if pixmap.isNull():
-            self.image_label.setText(f"画像の読み込みに失敗:\n{path}")
+        self._render_token += 1
+        cached = QPixmapCache.find(self._image_cache_key(path, self._zoom))
+        if cached is not None and not cached.isNull():
+            self._show_pixmap(cached, self._zoom)
+            self._update_buttons()
             return
 
-        # ズームを適用してスケーリング
-        scaled_width = int(pixmap.width() * self._zoom)
-        scaled_height = int(pixmap.height() * self._zoom)
-        scaled = pixmap.scaled(
-            scaled_width,
-            scaled_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.image_label.setPixmap(scaled)
+        # デコードとズーム縮小はワーカースレッドで行う（完了まで前の画像を表示）
+        task = ImageLoadTask(path, self._current_page, self._zoom, self._render_token)
+        task.signals.finished.connect(self._on_image_loaded)
+        task.signals.error.connect(self._on_image_error)
+        QThreadPool.globalInstance().start(task)
+        self._update_buttons()
+
+    def _on_image_loaded(self, token: int, index: int, zoom: float, image: QImage):
+        """画像デコード完了"""
+        if token != self._render_token:
+            return  # 古い要求の結果は破棄
+        pixmap = QPixmap.fromImage(image)
+        cache_key = self._image_cache_key(self._image_paths[index], zoom)
+        if QPixmapCache.insert(cache_key, pixmap):
+            self._image_cache_keys.add(cache_key)
+        self._show_pixmap(pixmap, zoom)
+
+    def _image_cache_key(self, path: Path, zoom: float) -> str:
+        """画像モードの QPixmapCache のキー"""
+        return f"img:{id(self)}:{path}:{round(zoom, 3)}"
+
+    def _clear_image_cache(self):
+        """画像モードでキャッシュした画像を削除"""
+        for cache_key in self._image_cache_keys:
+            QPixmapCache.remove(cache_key)
+        self._image_cache_keys.clear()
+
+    def _on_image_error(self, token: int, index: int, error: str):
+        """画像デコードエラー"""
+        if token != self._render_token:
+            return
+        path = self._image_paths[index]
+        self.image_label.setText(f"画像の読み込みに失敗:\n{path}\n{error}")
+
+    def _close_document(self):
+        """PDFドキュメントを閉じ、レンダリング状態を破棄"""
+        self._hires_timer.stop()
+        self._render_timer.stop()
+        self._zoom_base = None
+        self._render_token += 1  # 実行中のレンダリング結果を破棄
+        self._cancel_visible_render()
+        self._doc_serial += 1
+        for task in self._prefetch_tasks.values():
+            self._take_render_task(task)
+        self._prefetch_tasks.clear()
+        if self._prerender_task is not None:
+            self._take_render_task(self._prerender_task)
+            self._prerender_task = None
+        self._prerender_queue.clear()
+        self._prerender_bytes = 0
+        self._prerender_page_bytes = 0
+        self._inflight.clear()
+        for cache_key in self._page_cache_keys:
+            QPixmapCache.remove(cache_key)
+        self._page_cache_keys.clear()
+        self._page_count = 0
+
+        if self._pdf_doc is not None:
+            # 実行中のワーカーがドキュメントを使い終わるのを待ってから閉じる
+            with _MUPDF_LOCK:
+                self._pdf_doc.close()
+                self._pdf_doc = None
+                # 閉じたドキュメントのフォント・画像がMuPDFのストアに残らないよう解放
+                fitz.TOOLS.store_shrink(100)
+
+    def clear(self):
+        """表示をクリアしてリソースを解放"""
+        self._close_document()
+        self._clear_image_cache()
+        self._image_paths = []
+        self._current_page = 0
+        self.image_label.clear()
+        self.page_label.setText("/ 0")
         self._update_buttons()
 
+    def hideEvent(self, event):
+        """非表示時にMuPDFのストア（デコード済みリソースのキャッシュ）を空にする"""
+        # 画像表示のみのときは自分のドキュメントがないため、他のプレビューの分まで触らない
+        if HAS_PYMUPDF and self._pdf_doc is not None:
+            with _MUPDF_LOCK:
+                fitz.TOOLS.store_shrink(100)
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        """ウィジェット破棄時にドキュメントを閉じる"""
+        self._close_document()
+        super().closeEvent(event)
+
     @property
     def current_page(self) -> int:
         """現在のページ番号（1始まり）"""
@@ -258,4 +831,4 @@ class PDFPreviewWidget(QWidget):
     @property
     def page_count(self) -> int:
         """総ページ数"""
-        return len(self._pdf_doc) if self._pdf_doc else 0
+        return self._page_count if self._pdf_doc else 0
@@ -17,20 +17,23 @@ class ProgressPanel(QWidget):
     save_requested = pyqtSignal()  # 保存リクエスト
     load_saved_requested = pyqtSignal()  # 保存済み結果読み込みリクエスト
 
+    PROGRESS_FLUSH_MS = 33  # 進捗表示の更新間隔（約30Hz）
+
     def __init__(self):
         super().__init__()
         self._is_running = False
+        # 進捗更新はまとめて反映する（採点が速いとイベントループが詰まるため）
+        self._pending_progress: tuple[int, int, str] | None = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.PROGRESS_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_progress)
         self._setup_ui()
 
     def _setup_ui(self):
         """UI構築"""
+        self.setObjectName("progressPanel")
         self.setFixedHeight(100)
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f7f6f3;
-                border-bottom: 1px solid #e0e0e0;
-            }
-        """)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 8, 16, 8)
@@ -55,7 +58,7 @@ class ProgressPanel(QWidget):
 
         # ステータス
         self.status_label = QLabel("待機中")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #37352f;")
+        self.status_label.setObjectName("statusLabel")
         top_row.addWidget(self.status_label)
 
         top_row.addStretch()
@@ -66,76 +69,43 @@ class ProgressPanel(QWidget):
         bottom_row = QHBoxLayout()
 
         self.detail_label = QLabel("PDFを読み込んで採点を開始してください")
-        self.detail_label.setStyleSheet("font-size: 12px; color: #9b9a97;")
+        self.detail_label.setObjectName("detailLabel")
         bottom_row.addWidget(self.detail_label, 1)
 
         # プログレスバー
         self.progress_bar = QProgressBar()
         self.progress_bar.setFixedWidth(250)
         self.progress_bar.setTextVisible(True)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #fff;
-            }
-            QProgressBar::chunk {
-                background-color: #2eaadc;
-                border-radius: 3px;
-            }
-        """)
         bottom_row.addWidget(self.progress_bar)
 
         bottom_row.addSpacing(16)
 
         # アクションボタン
         self.action_btn = QPushButton("採点開始")
+        self.action_btn.setObjectName("actionButton")
         self.action_btn.setFixedWidth(120)
-        self.action_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2eaadc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2496c4;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
         self.action_btn.clicked.connect(self._on_action_clicked)
         bottom_row.addWidget(self.action_btn)
 
         # 保存ボタン
         self.save_btn = QPushButton("結果を保存")
+        self.save_btn.setObjectName("saveButton")
         self.save_btn.setFixedWidth(120)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0f7b0f;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0d6b0d;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
         self.save_btn.setEnabled(False)  # 初期状態は無効
         self.save_btn.clicked.connect(self._on_save_clicked)
         bottom_row.addWidget(self.save_btn)
 
         layout.addLayout(bottom_row)
 
+    @staticmethod
+    def _set_style_property(widget: QWidget, name: str, value):
+        """スタイル用の動的プロパティを切り替え（変わったときだけ再適用）"""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
     def _on_method_changed(self, index: int):
         """採点方法変更"""
         if index == 0:  # CLI
@@ -181,21 +151,9 @@ class ProgressPanel(QWidget):
         """採点開始"""
         self._is_running = True
         self.action_btn.setText("停止")
-        self.action_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #eb5757;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #d64545;
-            }
-        """)
+        self._set_style_property(self.action_btn, "danger", True)
         self.status_label.setText("採点中...")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #37352f;")
+        self._set_style_property(self.status_label, "state", "")
         self.method_combo.setEnabled(False)
 
         method = "cli" if self.method_combo.currentIndex() == 0 else "import"
@@ -203,27 +161,28 @@ class ProgressPanel(QWidget):
 
     def stop_grading(self):
         """採点停止"""
+        self._flush_progress()
         self._is_running = False
         self.action_btn.setText("採点開始")
-        self.action_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2eaadc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2496c4;
-            }
-        """)
+        self._set_style_property(self.action_btn, "danger", False)
         self.status_label.setText("停止")
         self.method_combo.setEnabled(True)
         self.grading_stopped.emit()
 
     def update_progress(self, current: int, total: int, detail: str = ""):
-        """進捗更新"""
+        """進捗更新（最新の値だけを一定間隔で反映）"""
+        self._pending_progress = (current, total, detail)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_progress(self):
+        """保留中の進捗を表示に反映"""
+        self._flush_timer.stop()
+        if self._pending_progress is None:
+            return
+        current, total, detail = self._pending_progress
+        self._pending_progress = None
+
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(current)
 
@@ -234,41 +193,34 @@ class ProgressPanel(QWidget):
 
     def set_complete(self):
         """完了状態に設定"""
+        self._flush_progress()
         self._is_running = False
         self._on_method_changed(self.method_combo.currentIndex())
         self.method_combo.setEnabled(True)
         self.status_label.setText("完了")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #0f7b0f;")
+        self._set_style_property(self.status_label, "state", "success")
         self.detail_label.setText("すべての採点が完了しました")
         self.save_btn.setEnabled(True)  # 保存ボタンを有効化
 
     def set_error(self, message: str):
         """エラー状態に設定"""
+        self._flush_progress()
         self._is_running = False
         self.action_btn.setText("再試行")
         self.method_combo.setEnabled(True)
         self.status_label.setText("エラー")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #eb5757;")
+        self._set_style_property(self.status_label, "state", "error")
         self.detail_label.setText(message)
 
     def set_saved(self, path: str):
         """保存完了状態に設定"""
         self.status_label.setText("保存済み")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #0f7b0f;")
+        self._set_style_property(self.status_label, "state", "success")
         self.detail_label.setText(f"保存先: {path}")
 
         # 保存ボタンを一時的に「保存しました」に変更
         self.save_btn.setText("保存しました")
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0f7b0f;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-        """)
+        self._set_style_property(self.save_btn, "saved", True)
 
         # 2秒後に元に戻す
         QTimer.singleShot(2000, self._reset_save_btn)
@@ -276,19 +228,4 @@ class ProgressPanel(QWidget):
     def _reset_save_btn(self):
         """保存ボタンを元に戻す"""
         self.save_btn.setText("結果を保存")
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0f7b0f;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0d6b0d;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self._set_style_property(self.save_btn, "saved", False)
@@ -1,15 +1,16 @@
 """クラス名簿管理パネル"""
 
 from __future__ import annotations
+import os
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QGroupBox, QPushButton, QFileDialog,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView,
     QMessageBox, QComboBox, QDialog, QFormLayout,
     QDialogButtonBox, QSpinBox
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
 
 from app.utils.roster_manager import (
     ClassRoster, Student, parse_roster_file,
@@ -18,6 +19,80 @@ from app.utils.roster_manager import (
 from app.utils.config import Config
 
 
+def _insertion_index(students: list[Student], attendance_no: int) -> int:
+    """出席番号順のリストに挿入する位置を二分探索（同じ番号の後ろ）
+
+    bisect の key 引数は Python 3.10 以降のため自前で実装している。
+    """
+    lo, hi = 0, len(students)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if attendance_no < students[mid].attendance_no:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+class RosterTableModel(QAbstractTableModel):
+    """生徒一覧テーブルのモデル（在籍中の生徒のみ表示）"""
+
+    HEADERS = ["出席番号", "姓", "名", "せい", "めい"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._students: list[Student] = []
+        # 表示文字列（data() は再描画のたびに呼ばれるため、行ごとに一度だけ整形しておく）
+        self._rows: list[tuple[str, str, str, str, str]] = []
+
+    @staticmethod
+    def _format_row(student: Student) -> tuple[str, str, str, str, str]:
+        """1行分の表示文字列"""
+        return (
+            f"{student.attendance_no:02d}",
+            student.last_name,
+            student.first_name,
+            student.last_name_kana,
+            student.first_name_kana,
+        )
+
+    def set_roster(self, roster: ClassRoster):
+        """名簿を差し替え"""
+        self.beginResetModel()
+        self._students = roster.get_active_students()
+        self._rows = [self._format_row(s) for s in self._students]
+        self.endResetModel()
+
+    def insert_student(self, student: Student):
+        """生徒を出席番号順の位置に1行追加"""
+        row = _insertion_index(self._students, student.attendance_no)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._students.insert(row, student)
+        self._rows.insert(row, self._format_row(student))
+        self.endInsertRows()
+
+    def student_count(self) -> int:
+        """表示中の生徒数"""
+        return len(self._rows)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class RosterPanel(QWidget):
     """クラス名簿管理パネル"""
 
@@ -26,8 +101,16 @@ class RosterPanel(QWidget):
     def __init__(self):
         super().__init__()
         self._roster: ClassRoster | None = None
+        self._max_attendance_no = 0  # 名簿内の最大の出席番号（生徒追加時の初期値用）
+        self._roster_list_loaded = False  # 初めて表示されたときに読み込む
         self._setup_ui()
 
+    def showEvent(self, event):
+        """初回表示時に保存済み名簿の一覧を読み込む（起動時の走査を避ける）"""
+        if not self._roster_list_loaded:
+            self._refresh_roster_list()
+        super().showEvent(event)
+
     def _setup_ui(self):
         """UI構築"""
         layout = QVBoxLayout(self)
@@ -76,9 +159,6 @@ class RosterPanel(QWidget):
         saved_layout.addStretch()
         layout.addWidget(saved_group)
 
-        # 名簿読み込み
-        self._refresh_roster_list()
-
         # 名簿操作
         action_group = QGroupBox("新規名簿を追加")
         action_layout = QHBoxLayout(action_group)
@@ -126,19 +206,21 @@ class RosterPanel(QWidget):
         self.status_label.setStyleSheet("color: #9b9a97;")
         table_layout.addWidget(self.status_label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "出席番号", "姓", "名", "せい", "めい"
-        ])
+        # 表示する行のセルだけが描画されるよう、モデル/ビューで構成
+        self._model = RosterTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # 行の高さを固定し、行ごとの高さ計算（sizeHint の問い合わせ）をなくす
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(28)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #e0e0e0;
                 border-radius: 4px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
             }
         """)
@@ -239,6 +321,7 @@ class RosterPanel(QWidget):
 
     def _refresh_roster_list(self):
         """保存済み名簿リストを更新"""
+        self._roster_list_loaded = True
         self.roster_combo.clear()
         self.roster_combo.addItem("-- 選択してください --", None)
 
@@ -246,10 +329,13 @@ class RosterPanel(QWidget):
         if not roster_dir.exists():
             return
 
-        for json_file in sorted(roster_dir.glob("*.json")):
+        with os.scandir(roster_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".json"))
+
+        for name in names:
             # ファイル名から表示名を生成（拡張子を除く）
-            display_name = json_file.stem.replace("_", " ")
-            self.roster_combo.addItem(display_name, str(json_file))
+            display_name = name[:-len(".json")].replace("_", " ")
+            self.roster_combo.addItem(display_name, str(roster_dir / name))
 
     def _on_roster_selected(self, index: int):
         """ドロップダウンで名簿が選択された"""
@@ -275,19 +361,17 @@ class RosterPanel(QWidget):
         if not self._roster:
             return
 
-        active_students = self._roster.get_active_students()
-        self.table.setRowCount(len(active_students))
-
-        for row, student in enumerate(active_students):
-            self.table.setItem(row, 0, QTableWidgetItem(f"{student.attendance_no:02d}"))
-            self.table.setItem(row, 1, QTableWidgetItem(student.last_name))
-            self.table.setItem(row, 2, QTableWidgetItem(student.first_name))
-            self.table.setItem(row, 3, QTableWidgetItem(student.last_name_kana))
-            self.table.setItem(row, 4, QTableWidgetItem(student.first_name_kana))
+        self._model.set_roster(self._roster)
+        self._max_attendance_no = max(
+            (s.attendance_no for s in self._roster.students), default=0
+        )
+        self._update_status_label()
 
+    def _update_status_label(self):
+        """在籍人数の表示を更新"""
         self.status_label.setText(
             f"{self._roster.year} {self._roster.class_name}: "
-            f"{len(active_students)} 名（在籍）"
+            f"{self._model.student_count()} 名（在籍）"
         )
 
     def get_roster(self) -> ClassRoster | None:
@@ -309,8 +393,7 @@ class RosterPanel(QWidget):
         attendance_spin = QSpinBox()
         attendance_spin.setRange(1, 99)
         # 次の出席番号を自動設定
-        max_no = max((s.attendance_no for s in self._roster.students), default=0)
-        attendance_spin.setValue(max_no + 1)
+        attendance_spin.setValue(self._max_attendance_no + 1)
         layout.addRow("出席番号:", attendance_spin)
 
         last_name_input = QLineEdit()
@@ -349,9 +432,14 @@ class RosterPanel(QWidget):
                 first_name_kana=first_name_kana_input.text(),
                 status="在籍"
             )
-            self._roster.students.append(new_student)
-            self._roster.students.sort(key=lambda s: s.attendance_no)
-            self._update_table()
+            # 名簿は出席番号順なので、並べ替えずに挿入位置を二分探索する
+            self._roster.students.insert(
+                _insertion_index(self._roster.students, new_student.attendance_no),
+                new_student
+            )
+            self._max_attendance_no = max(self._max_attendance_no, new_student.attendance_no)
+            self._model.insert_student(new_student)
+            self._update_status_label()
             self.roster_loaded.emit(self._roster)
 
     def _reload_roster(self):
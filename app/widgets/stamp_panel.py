@@ -2,30 +2,117 @@
 
 from __future__ import annotations
 from pathlib import Path
+import hashlib
+import os
 import shutil
+import tempfile
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGroupBox, QPushButton, QFileDialog, QComboBox,
     QSpinBox, QListWidget, QListWidgetItem, QSplitter,
-    QMessageBox, QScrollArea, QGridLayout, QCheckBox
+    QMessageBox, QListView, QAbstractItemView, QMenu, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QTimer, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QIcon, QStandardItemModel, QStandardItem
 
 from app.utils.config import Config
 
 
+class _ThumbnailSignals(QObject):
+    """StampThumbnailTask のシグナル（QRunnable は QObject ではないため分離）"""
+
+    finished = pyqtSignal(int, str, str, QImage)  # トークン, スタンプのパス, キャッシュキー, サムネイル
+
+
+class StampThumbnailTask(QRunnable):
+    """スタンプのサムネイルをワーカースレッドで作成するタスク
+
+    ディスク上のサムネイルがあればそれを読み、なければ元画像を縮小して保存する。
+    """
+
+    def __init__(self, stamp_path: Path, thumb_path: Path, cache_key: str, size: int, token: int):
+        super().__init__()
+        self.signals = _ThumbnailSignals()
+        self._stamp_path = stamp_path
+        self._thumb_path = thumb_path
+        self._cache_key = cache_key
+        self._size = size
+        self._token = token
+
+    def run(self):
+        """サムネイル作成"""
+        image = QImage(str(self._thumb_path)) if self._thumb_path.exists() else QImage()
+        if image.isNull():
+            original = QImage(str(self._stamp_path))
+            if not original.isNull():
+                image = original.scaled(
+                    self._size, self._size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                self._save_thumbnail(image)
+
+        self.signals.finished.emit(self._token, str(self._stamp_path), self._cache_key, image)
+
+    def _save_thumbnail(self, image: QImage):
+        """一時ファイルに書いてから置き換える
+
+        カテゴリを行き来すると同じスタンプのタスクが重なるため、
+        書きかけのPNGを他のタスクが読んだり、同時に上書きしたりしないようにする。
+        """
+        thumb_dir = self._thumb_path.parent
+        try:
+            thumb_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=thumb_dir, prefix=self._thumb_path.name, suffix=".tmp")
+            os.close(fd)
+        except OSError:
+            return  # キャッシュを書けなくても表示はできる
+        try:
+            if image.save(tmp, "PNG"):
+                os.replace(tmp, self._thumb_path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
 class StampPanel(QWidget):
     """スタンプ管理パネル"""
 
     settings_changed = pyqtSignal()  # 設定変更シグナル
 
+    THUMB_SIZE = 96  # 一覧に表示するサムネイルのサイズ（px）
+
     def __init__(self):
         super().__init__()
         self._settings = Config.load_stamp_settings()
+        self._current_category_id: str | None = None  # 表示中のカテゴリ
+        self._stamp_items: dict[str, QStandardItem] = {}  # 表示中のスタンプ（パス文字列 -> 項目）
+        self._display_token = 0  # 表示切り替えごとに増加（古いサムネイル結果の破棄用）
+        # カテゴリID -> スタンプ画像一覧（追加・削除時に破棄）
+        self._stamps_cache: dict[str, list[Path]] = {}
+        self._stamps_loaded = False  # 初めて表示されたときに読み込む
+
+        # デバウンス用タイマー（スピンボックス操作のたびに設定ファイルを書き込まない）
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(400)  # 400ms
+        self._save_timer.timeout.connect(self._save_settings)
+        self._categories_changed = False  # 保存時にカテゴリ一覧の表示を更新するか
         Config.ensure_stamp_dirs()
         self._setup_ui()
-        self._load_stamps()
+
+    def showEvent(self, event):
+        """初回表示時にスタンプフォルダを読み込む（起動時の走査を避ける）"""
+        if not self._stamps_loaded:
+            self._stamps_loaded = True
+            self._load_stamps()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """非表示になる前に保留中の設定を保存"""
+        if self._save_timer.isActive():
+            self._save_settings()
+        super().hideEvent(event)
 
     def _setup_ui(self):
         """UI構築"""
@@ -107,24 +194,43 @@ class StampPanel(QWidget):
         self.category_name_label.setStyleSheet("font-size: 16px; font-weight: bold;")
         layout.addWidget(self.category_name_label)
 
-        # スタンプグリッド（スクロール可能）
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
+        # スタンプ一覧（アイコン表示。見えている項目だけが描画される）
+        self._stamp_model = QStandardItemModel(self)
+        self.stamp_view = QListView()
+        self.stamp_view.setModel(self._stamp_model)
+        self.stamp_view.setViewMode(QListView.ViewMode.IconMode)
+        self.stamp_view.setIconSize(QSize(self.THUMB_SIZE, self.THUMB_SIZE))
+        self.stamp_view.setGridSize(QSize(120, 140))
+        self.stamp_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.stamp_view.setMovement(QListView.Movement.Static)
+        self.stamp_view.setUniformItemSizes(True)
+        self.stamp_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.stamp_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.stamp_view.customContextMenuRequested.connect(self._show_stamp_menu)
+        self.stamp_view.selectionModel().selectionChanged.connect(self._on_stamp_selection_changed)
+        self.stamp_view.setStyleSheet("""
+            QListView {
                 border: 1px solid #e0e0e0;
                 border-radius: 8px;
                 background-color: #fafafa;
+                padding: 8px;
+            }
+            QListView::item {
+                background-color: white;
+                border: 1px solid #e0e0e0;
+                border-radius: 8px;
+                margin: 4px;
+            }
+            QListView::item:hover {
+                border-color: #2eaadc;
+            }
+            QListView::item:selected {
+                border: 2px solid #2eaadc;
+                background-color: #e8f4fc;
             }
         """)
 
-        self.stamps_container = QWidget()
-        self.stamps_layout = QGridLayout(self.stamps_container)
-        self.stamps_layout.setSpacing(16)
-        self.stamps_layout.setContentsMargins(16, 16, 16, 16)
-        scroll.setWidget(self.stamps_container)
-
-        layout.addWidget(scroll, 1)
+        layout.addWidget(self.stamp_view, 1)
 
         # ボタン
         btn_layout = QHBoxLayout()
@@ -146,6 +252,23 @@ class StampPanel(QWidget):
         """)
         btn_layout.addWidget(self.add_stamp_btn)
 
+        self.delete_stamp_btn = QPushButton("選択したスタンプを削除")
+        self.delete_stamp_btn.setEnabled(False)
+        self.delete_stamp_btn.clicked.connect(self._delete_selected_stamp)
+        self.delete_stamp_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #ff6b6b;
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 8px 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover { background-color: #ee5a5a; }
+            QPushButton:disabled { background-color: #ccc; }
+        """)
+        btn_layout.addWidget(self.delete_stamp_btn)
+
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
 
@@ -224,14 +347,15 @@ class StampPanel(QWidget):
         categories = self._settings.get("categories", Config.DEFAULT_STAMP_CATEGORIES)
 
         for category in categories:
-            stamps = Config.get_stamps_for_category(category["id"])
-            count = len(stamps)
-            item = QListWidgetItem(
-                f"{category['name']} ({category['min_score']}-{category['max_score']}点) [{count}枚]"
-            )
+            item = QListWidgetItem(self._category_label(category))
             item.setData(Qt.ItemDataRole.UserRole, category)
             self.category_list.addItem(item)
 
+    def _category_label(self, category: dict) -> str:
+        """カテゴリ一覧に表示する文字列"""
+        count = len(self._get_stamps(category["id"]))
+        return f"{category['name']} ({category['min_score']}-{category['max_score']}点) [{count}枚]"
+
     def _on_category_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
         """カテゴリ選択"""
         if not current:
@@ -255,80 +379,123 @@ class StampPanel(QWidget):
         # スタンプを表示
         self._display_stamps(category["id"])
 
+    def _get_stamps(self, category_id: str) -> list[Path]:
+        """カテゴリ内のスタンプ画像を取得（フォルダの走査結果をキャッシュ）"""
+        stamps = self._stamps_cache.get(category_id)
+        if stamps is None:
+            stamps = self._stamps_cache[category_id] = Config.get_stamps_for_category(category_id)
+        return stamps
+
     def _clear_stamps_display(self):
         """スタンプ表示をクリア"""
-        while self.stamps_layout.count():
-            item = self.stamps_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._stamp_model.clear()
+        self._stamp_items.clear()
+        self._display_token += 1
+        self.delete_stamp_btn.setEnabled(False)  # モデルのリセットでは選択変更が通知されない
+        self._current_category_id = None
+
+    def _display_stamps(self, category_id: str, force: bool = False):
+        """スタンプを表示
+
+        同じカテゴリを再選択したときは何もしない（追加・削除後は force=True）。
+        """
+        if category_id == self._current_category_id and not force:
+            return
 
-    def _display_stamps(self, category_id: str):
-        """スタンプを表示"""
         self._clear_stamps_display()
-
-        stamps = Config.get_stamps_for_category(category_id)
-
-        for i, stamp_path in enumerate(stamps):
-            stamp_widget = self._create_stamp_widget(stamp_path)
-            row = i // 3
-            col = i % 3
-            self.stamps_layout.addWidget(stamp_widget, row, col)
-
-        # 空きスペースを埋める
-        self.stamps_layout.setRowStretch(len(stamps) // 3 + 1, 1)
-
-    def _create_stamp_widget(self, stamp_path: Path) -> QWidget:
-        """スタンプウィジェットを作成"""
-        widget = QWidget()
-        widget.setFixedSize(120, 140)
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-            QWidget:hover {
-                border-color: #2eaadc;
-            }
-        """)
-
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(4)
-
-        # 画像
-        image_label = QLabel()
-        image_label.setFixedSize(100, 100)
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        pixmap = QPixmap(str(stamp_path))
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                96, 96,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+        self._current_category_id = category_id
+
+        pool = QThreadPool.globalInstance()
+        for stamp_path in self._get_stamps(category_id):
+            item = QStandardItem("")
+            item.setData(stamp_path, Qt.ItemDataRole.UserRole)
+            item.setToolTip(stamp_path.name)
+            item.setEditable(False)
+            self._stamp_model.appendRow(item)
+
+            try:
+                mtime_ns = stamp_path.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            # キャッシュ済みならすぐに表示し、なければワーカーで作成して後から差し込む
+            cache_key = self._thumbnail_cache_key(stamp_path, mtime_ns)
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is not None and not pixmap.isNull():
+                item.setIcon(QIcon(pixmap))
+                continue
+
+            self._stamp_items[str(stamp_path)] = item
+            task = StampThumbnailTask(
+                stamp_path, self._thumbnail_path(stamp_path, mtime_ns),
+                cache_key, self.THUMB_SIZE, self._display_token
             )
-            image_label.setPixmap(scaled)
+            task.signals.finished.connect(self._on_thumbnail_loaded)
+            pool.start(task)
 
-        layout.addWidget(image_label)
+    def _on_thumbnail_loaded(self, token: int, stamp_path: str, cache_key: str, image: QImage):
+        """サムネイル作成完了（GUIスレッド）"""
+        if image.isNull():
+            return
 
-        # 削除ボタン
-        delete_btn = QPushButton("削除")
-        delete_btn.setFixedHeight(24)
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff6b6b;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-            }
-            QPushButton:hover { background-color: #ee5a5a; }
-        """)
-        delete_btn.clicked.connect(lambda: self._delete_stamp(stamp_path))
-        layout.addWidget(delete_btn)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        if token != self._display_token:
+            return  # 別のカテゴリに切り替わった
+
+        item = self._stamp_items.pop(stamp_path, None)
+        if item is not None:
+            item.setIcon(QIcon(pixmap))
+
+    def _selected_stamp(self) -> Path | None:
+        """選択中のスタンプのパス"""
+        indexes = self.stamp_view.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return indexes[0].data(Qt.ItemDataRole.UserRole)
+
+    def _on_stamp_selection_changed(self, *_):
+        """スタンプ選択変更"""
+        self.delete_stamp_btn.setEnabled(self._selected_stamp() is not None)
+
+    def _show_stamp_menu(self, pos: QPoint):
+        """スタンプの右クリックメニュー"""
+        index = self.stamp_view.indexAt(pos)
+        if not index.isValid():
+            return
 
-        return widget
+        stamp_path = index.data(Qt.ItemDataRole.UserRole)
+        menu = QMenu(self)
+        delete_action = menu.addAction("削除")
+        if menu.exec(self.stamp_view.viewport().mapToGlobal(pos)) == delete_action:
+            self._delete_stamp(stamp_path)
+
+    def _delete_selected_stamp(self):
+        """選択中のスタンプを削除"""
+        stamp_path = self._selected_stamp()
+        if stamp_path is not None:
+            self._delete_stamp(stamp_path)
+
+    @classmethod
+    def _thumbnail_path(cls, stamp_path: Path, mtime_ns: int) -> Path:
+        """ディスク上のサムネイルキャッシュのパス（更新時刻が変われば別ファイル）"""
+        digest = hashlib.sha1(f"{stamp_path}:{mtime_ns}".encode("utf-8")).hexdigest()
+        return Config.STAMP_THUMBS_PATH / f"{digest}.png"
+
+    @staticmethod
+    def _thumbnail_cache_key(stamp_path: Path, mtime_ns: int) -> str:
+        """QPixmapCache のキー（(パス, 更新時刻) ごとに区別）"""
+        return f"stamp:{stamp_path}:{mtime_ns}"
+
+    @classmethod
+    def _discard_thumbnail(cls, stamp_path: Path):
+        """削除するスタンプのサムネイルを破棄（ファイル削除の前に呼ぶ）"""
+        try:
+            mtime_ns = stamp_path.stat().st_mtime_ns
+        except OSError:
+            return
+        QPixmapCache.remove(cls._thumbnail_cache_key(stamp_path, mtime_ns))
+        cls._thumbnail_path(stamp_path, mtime_ns).unlink(missing_ok=True)
 
     def _add_stamp(self):
         """スタンプを追加"""
@@ -361,11 +528,13 @@ class StampPanel(QWidget):
                 dst = category_path / f"{src.stem}_{counter}{src.suffix}"
                 counter += 1
 
-            shutil.copy(src, dst)
+            # 権限ビットは引き継がない（copymode の chmod を省き、sendfile 等の高速コピーのみ行う）
+            shutil.copyfile(src, dst)
 
         # 表示更新
-        self._display_stamps(category["id"])
-        self._load_stamps()  # カウント更新
+        self._stamps_cache.pop(category["id"], None)
+        self._display_stamps(category["id"], force=True)
+        current.setText(self._category_label(category))  # 枚数を更新
 
         QMessageBox.information(
             self, "追加完了",
@@ -384,14 +553,16 @@ class StampPanel(QWidget):
             return
 
         try:
+            self._discard_thumbnail(stamp_path)
             stamp_path.unlink()
 
             # 表示更新
             current = self.category_list.currentItem()
             if current:
                 category = current.data(Qt.ItemDataRole.UserRole)
-                self._display_stamps(category["id"])
-                self._load_stamps()
+                self._stamps_cache.pop(category["id"], None)
+                self._display_stamps(category["id"], force=True)
+                current.setText(self._category_label(category))  # 枚数を更新
 
         except Exception as e:
             QMessageBox.critical(self, "エラー", f"削除に失敗しました:\n{e}")
@@ -420,8 +591,8 @@ class StampPanel(QWidget):
                 break
 
         self._settings["categories"] = categories
-        self._save_settings()
-        self._load_stamps()
+        self._categories_changed = True
+        self._save_timer.start()  # タイマーをリスタート
 
     def _on_position_changed(self, index: int):
         """配置位置変更"""
@@ -432,15 +603,19 @@ class StampPanel(QWidget):
     def _on_size_changed(self, value: int):
         """サイズ変更"""
         self._settings["size"] = value
-        self._save_settings()
+        self._save_timer.start()
 
     def _on_margin_changed(self):
         """マージン変更"""
         self._settings["margin_x"] = self.margin_x_spin.value()
         self._settings["margin_y"] = self.margin_y_spin.value()
-        self._save_settings()
+        self._save_timer.start()
 
     def _save_settings(self):
-        """設定を保存"""
+        """設定を保存（保留中の変更もまとめて書き込む）"""
+        self._save_timer.stop()
         Config.save_stamp_settings(self._settings)
         self.settings_changed.emit()
+        if self._categories_changed:
+            self._categories_changed = False
+            self._load_stamps()
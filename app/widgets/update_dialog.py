@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
@@ -27,25 +29,43 @@ class DownloadWorker(QThread):
     """ダウンロードワーカー"""
 
     progress = pyqtSignal(int, int)  # downloaded, total
-    finished = pyqtSignal(object)  # zip_path or None
+    finished = pyqtSignal(str)  # zip_path（失敗時は空文字）
     error = pyqtSignal(str)
 
+    PROGRESS_INTERVAL = 0.1  # 進捗シグナルの最短間隔（秒）
+
     def __init__(self, checker: "UpdateChecker", release: "ReleaseInfo"):
         super().__init__()
         self.checker = checker
         self.release = release
+        self._last_percent = -1
+        self._last_emit = 0.0
 
     def run(self):
         try:
             zip_path = self.checker.download_update(
                 self.release,
-                progress_callback=lambda d, t: self.progress.emit(d, t)
+                progress_callback=self._on_chunk
             )
-            self.finished.emit(zip_path)
+            self.finished.emit(str(zip_path or ""))
         except Exception as e:
             logger.error(f"Download failed: {e}")
             self.error.emit(str(e))
 
+    def _on_chunk(self, downloaded: int, total: int):
+        """チャンク受信ごとの進捗（8KBごとに呼ばれるため、%が変わったときだけ間引いて通知）"""
+        percent = int(downloaded * 100 / total) if total else 0
+        now = time.monotonic()
+        finished = total > 0 and downloaded >= total
+        if not finished and (
+            percent == self._last_percent or now - self._last_emit < self.PROGRESS_INTERVAL
+        ):
+            return
+
+        self._last_percent = percent
+        self._last_emit = now
+        self.progress.emit(downloaded, total)
+
 
 class UpdateDialog(QDialog):
     """アップデート確認ダイアログ"""
@@ -55,7 +75,13 @@ class UpdateDialog(QDialog):
         self.checker = checker
         self.release = release
         self._download_worker: DownloadWorker | None = None
+        # 進捗表示は「今すぐ更新」が押されたときに作る（「後で」なら不要なため）
+        self.progress_bar: QProgressBar | None = None
+        self.status_label: QLabel | None = None
+        self._total_bytes = 0
+        self._total_mb_text = ""  # 合計サイズの表示文字列（合計が変わったときだけ作る）
 
+        self.setObjectName("updateDialog")
         self.setWindowTitle("アップデート")
         self.setMinimumWidth(450)
         self.setModal(True)
@@ -63,52 +89,34 @@ class UpdateDialog(QDialog):
         self._setup_ui()
 
     def _setup_ui(self):
+        """UI構築（スタイルは app.qss の #updateDialog 以下で定義）"""
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
+        self._layout = layout
 
         # タイトル
         title = QLabel(f"新バージョン v{self.release.version} が利用可能です")
-        title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
         # 現在のバージョン
         current_label = QLabel(f"現在のバージョン: v{self.checker.current_version}")
-        current_label.setStyleSheet("color: #666;")
+        current_label.setObjectName("versionLabel")
         layout.addWidget(current_label)
 
         # リリースノート
         if self.release.release_notes:
             notes_label = QLabel("更新内容:")
-            notes_label.setStyleSheet("font-weight: bold; margin-top: 8px;")
+            notes_label.setObjectName("notesLabel")
             layout.addWidget(notes_label)
 
             notes_text = QTextEdit()
             notes_text.setReadOnly(True)
             notes_text.setPlainText(self.release.release_notes)
             notes_text.setMaximumHeight(150)
-            notes_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f5f5f5;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            notes_text.setObjectName("notesText")
             layout.addWidget(notes_text)
 
-        # プログレスバー（初期は非表示）
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setTextVisible(True)
-        self.progress_bar.setFormat("ダウンロード中... %p%")
-        self.progress_bar.hide()
-        layout.addWidget(self.progress_bar)
-
-        # ステータスラベル
-        self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666;")
-        self.status_label.hide()
-        layout.addWidget(self.status_label)
-
         # ボタン
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -119,29 +127,32 @@ class UpdateDialog(QDialog):
 
         self.update_btn = QPushButton("今すぐ更新")
         self.update_btn.setDefault(True)
-        self.update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.update_btn.setObjectName("updateButton")
         self.update_btn.clicked.connect(self._start_update)
         button_layout.addWidget(self.update_btn)
 
         layout.addLayout(button_layout)
 
+    def _ensure_progress_widgets(self):
+        """プログレスバーとステータスラベルを作成（ボタン行の上に挿入）"""
+        if self.progress_bar is not None:
+            return
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.progress_bar.setFormat("ダウンロード中... %p%")
+        self._layout.insertWidget(self._layout.count() - 1, self.progress_bar)
+
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("statusLabel")
+        self._layout.insertWidget(self._layout.count() - 1, self.status_label)
+
     def _start_update(self):
         """アップデート開始"""
+        if self._download_worker is not None and self._download_worker.isRunning():
+            return  # ダウンロードは同時に1つだけ
+
+        self._ensure_progress_widgets()
         self.update_btn.setEnabled(False)
         self.later_btn.setEnabled(False)
         self.progress_bar.show()
@@ -159,12 +170,17 @@ class UpdateDialog(QDialog):
         """ダウンロード進捗"""
         if total > 0:
             percent = int(downloaded / total * 100)
+            if percent == self.progress_bar.value():
+                return
             self.progress_bar.setValue(percent)
-            mb_downloaded = downloaded / (1024 * 1024)
-            mb_total = total / (1024 * 1024)
-            self.status_label.setText(f"ダウンロード中... {mb_downloaded:.1f} / {mb_total:.1f} MB")
+            if total != self._total_bytes:
+                self._total_bytes = total
+                self._total_mb_text = f"{total / 1048576:.1f}"
+            self.status_label.setText(
+                f"ダウンロード中... {downloaded / 1048576:.1f} / {self._total_mb_text} MB"
+            )
 
-    def _on_download_finished(self, zip_path):
+    def _on_download_finished(self, zip_path: str):
         """ダウンロード完了"""
         if not zip_path:
             self._on_error("ダウンロードに失敗しました")
@@ -175,7 +191,7 @@ class UpdateDialog(QDialog):
         self.progress_bar.setValue(100)
 
         # インストール実行
-        if self.checker.install_update(zip_path):
+        if self.checker.install_update(Path(zip_path)):
             self.status_label.setText("インストール完了！再起動します...")
             QMessageBox.information(
                 self,
@@ -190,7 +206,9 @@ class UpdateDialog(QDialog):
         """エラー発生"""
         self.progress_bar.hide()
         self.status_label.setText(f"エラー: {error}")
-        self.status_label.setStyleSheet("color: red;")
+        self.status_label.setProperty("state", "error")
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
         self.update_btn.setEnabled(True)
         self.later_btn.setEnabled(True)
         QMessageBox.critical(self, "アップデートエラー", error)
@@ -1,47 +1,145 @@
 """週管理パネル"""
 
 from __future__ import annotations
+import os
 import re
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGroupBox, QPushButton, QComboBox,
     QSpinBox, QTextEdit, QMessageBox, QListWidget,
-    QListWidgetItem, QSplitter, QLineEdit
+    QListWidgetItem, QLineEdit
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QFileSystemWatcher, QSignalBlocker, QObject, QRunnable, QThreadPool, QTimer
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 
 from app.utils.config import Config
 
+_WEEK_DIR_RE = re.compile(r"第([0-9]{2})週")  # 週フォルダ名 "第XX週"
+_WEEK_STATUS = ("", " △", " ✓")  # prompt/problem のうち揃っているファイル数 → 状態表示
+
+# problem.tex の \def\キー{値} パターン（3つのキーを1回の走査で抽出、複数行対応）
+_PROBLEM_DEF_RE = re.compile(
+    r'\\def\\(週タイトル|テーマ|問題文)\{((?:[^{}]|\{[^{}]*\})*)\}', re.DOTALL
+)
+
+
+def _write_text_atomic(path: Path, text: str):
+    """一時ファイルに書いてから置き換える（途中で落ちても元のファイルを壊さない）"""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(text.encode("utf-8"))
+    os.replace(tmp, path)
+
+
+def _scan_weeks(term: str) -> list[tuple[int, bool, bool]]:
+    """学期フォルダを走査して (週番号, prompt有無, problem有無) を返す"""
+    term_path = Config.WEEKS_PATH / term
+    weeks = []
+    try:
+        with os.scandir(term_path) as it:
+            for entry in it:
+                match = _WEEK_DIR_RE.fullmatch(entry.name)
+                if not match or not entry.is_dir(follow_symlinks=False):
+                    continue
+                week_num = int(match.group(1))
+
+                # プロンプトと問題文の有無を1回の走査でチェック
+                has_prompt = has_problem = False
+                with os.scandir(entry.path) as files:
+                    for f in files:
+                        if f.name == "prompt.txt":
+                            has_prompt = True
+                        elif f.name == "problem.tex":
+                            has_problem = True
+                        if has_prompt and has_problem:
+                            break
+                weeks.append((week_num, has_prompt, has_problem))
+    except OSError:
+        return []
+
+    weeks.sort()
+    return weeks
+
+
+class _WeekScanSignals(QObject):
+    """WeekScanTask のシグナル（QRunnable は QObject ではないため分離）"""
+
+    finished = pyqtSignal(int, str, list)  # 通番, 学期, [(週番号, prompt有無, problem有無)]
+
+
+class WeekScanTask(QRunnable):
+    """学期フォルダの走査をワーカースレッドで行うタスク"""
+
+    def __init__(self, term: str, serial: int):
+        super().__init__()
+        self.signals = _WeekScanSignals()
+        self._term = term
+        self._serial = serial
+
+    def run(self):
+        """走査"""
+        self.signals.finished.emit(self._serial, self._term, _scan_weeks(self._term))
+
 
 class WeekManagerPanel(QWidget):
     """週管理パネル"""
 
     week_updated = pyqtSignal()  # 週が更新された
 
+    WATCH_DEBOUNCE_MS = 200  # フォルダ変更通知をまとめる間隔
+
     def __init__(self):
         super().__init__()
         self._current_term: str | None = None
         self._current_week: int | None = None
+        # 選択中の週のファイルパス（選択時に一度だけ組み立てる）
+        self._current_week_path: Path | None = None
+        self._current_prompt_path: Path | None = None
+        self._current_problem_path: Path | None = None
+        # ファイルパス → (mtime_ns, サイズ, 内容)（変更がなければ再読み込みしない）
+        self._file_cache: dict[str, tuple[int, int, str]] = {}
+        self._week_items: dict[int, QListWidgetItem] = {}  # 週番号 → リスト項目
+        # 学期 → {週番号: (prompt有無, problem有無)}（外部変更はウォッチャーで検知）
+        self._weeks_cache: dict[str, dict[int, tuple[bool, bool]]] = {}
+        self._scan_serial = 0  # 走査の通番（古い結果を捨てるため）
+        self._weeks_loaded = False  # 初めて表示されたときに読み込む
         self._setup_ui()
-        self._refresh_weeks()
+
+    def showEvent(self, event):
+        """初回表示時に週リストを読み込む（起動時の走査を避ける）"""
+        if not self._weeks_loaded:
+            self._weeks_loaded = True
+            self._refresh_weeks()
+        super().showEvent(event)
 
     def _setup_ui(self):
-        """UI構築"""
+        """UI構築（スタイルは app.qss の #weekManagerPanel 以下で定義）"""
+        self.setObjectName("weekManagerPanel")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(24)
 
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_directory_changed)
+        # 一度に複数の変更通知が来ても再走査は1回にまとめる
+        self._changed_dirs: set[str] = set()
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(self.WATCH_DEBOUNCE_MS)
+        self._watch_timer.timeout.connect(self._apply_directory_changes)
+
         # タイトル
         title = QLabel("週管理")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #37352f;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
-        # メインスプリッター
-        splitter = QSplitter(Qt.Orientation.Horizontal)
+        # メイン（左は固定幅、右が伸縮）
+        main_layout = QHBoxLayout()
 
         # 左側：週一覧
         left_widget = QWidget()
+        left_widget.setFixedWidth(250)
         left_layout = QVBoxLayout(left_widget)
         left_layout.setContentsMargins(0, 0, 0, 0)
 
@@ -75,7 +173,7 @@ class WeekManagerPanel(QWidget):
         add_layout.addStretch()
         left_layout.addLayout(add_layout)
 
-        splitter.addWidget(left_widget)
+        main_layout.addWidget(left_widget)
 
         # 右側：詳細編集
         right_widget = QWidget()
@@ -84,7 +182,7 @@ class WeekManagerPanel(QWidget):
 
         # 週情報
         self.week_info = QLabel("週を選択してください")
-        self.week_info.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.week_info.setObjectName("weekInfo")
         right_layout.addWidget(self.week_info)
 
         # 問題文（problem.tex）
@@ -120,18 +218,7 @@ class WeekManagerPanel(QWidget):
         self.save_problem_btn = QPushButton("問題文を保存")
         self.save_problem_btn.setEnabled(False)
         self.save_problem_btn.clicked.connect(self._save_problem)
-        self.save_problem_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0f7b0f;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #0d6b0d; }
-            QPushButton:disabled { background-color: #ccc; }
-        """)
+        self.save_problem_btn.setObjectName("saveButton")
         problem_btn_layout.addWidget(self.save_problem_btn)
         problem_btn_layout.addStretch()
         problem_layout.addLayout(problem_btn_layout)
@@ -151,18 +238,7 @@ class WeekManagerPanel(QWidget):
         self.save_prompt_btn = QPushButton("採点基準を保存")
         self.save_prompt_btn.setEnabled(False)
         self.save_prompt_btn.clicked.connect(self._save_prompt)
-        self.save_prompt_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0f7b0f;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #0d6b0d; }
-            QPushButton:disabled { background-color: #ccc; }
-        """)
+        self.save_prompt_btn.setObjectName("saveButton")
         prompt_btn_layout.addWidget(self.save_prompt_btn)
         prompt_btn_layout.addStretch()
         prompt_layout.addLayout(prompt_btn_layout)
@@ -170,58 +246,112 @@ class WeekManagerPanel(QWidget):
         right_layout.addWidget(prompt_group)
         right_layout.addStretch()
 
-        splitter.addWidget(right_widget)
-        splitter.setSizes([250, 500])
+        main_layout.addWidget(right_widget, 1)
+
+        layout.addLayout(main_layout, 1)
+
+    def _watch_term(self, term: str):
+        """学期フォルダを監視対象に追加"""
+        term_path = str(Config.WEEKS_PATH / term)
+        if term_path not in self._fs_watcher.directories() and os.path.isdir(term_path):
+            self._fs_watcher.addPath(term_path)
 
-        layout.addWidget(splitter, 1)
+    def _on_directory_changed(self, path: str):
+        """学期フォルダの変更通知（デバウンスしてから再走査）"""
+        self._changed_dirs.add(path)
+        self._watch_timer.start()
+
+    def _apply_directory_changes(self):
+        """変更があった学期のキャッシュを破棄し、表示中の学期なら再走査"""
+        changed, self._changed_dirs = self._changed_dirs, set()
+        for term in list(self._weeks_cache):
+            if str(Config.WEEKS_PATH / term) in changed:
+                del self._weeks_cache[term]
+        if str(Config.WEEKS_PATH / self.term_combo.currentText()) in changed:
+            self._refresh_weeks()
 
     def _refresh_weeks(self):
-        """週リストを更新"""
-        self.week_list.clear()
+        """週リストを更新（キャッシュがなければワーカースレッドで走査）"""
         term = self.term_combo.currentText()
-
-        term_path = Config.WEEKS_PATH / term
-        if not term_path.exists():
+        weeks = self._weeks_cache.get(term)
+        if weeks is not None:
+            self._populate_weeks(weeks)
             return
 
-        # 週フォルダを取得
-        weeks = []
-        for week_dir in term_path.iterdir():
-            if week_dir.is_dir() and week_dir.name.startswith("第"):
-                try:
-                    # "第XX週" から番号を抽出
-                    week_num = int(week_dir.name[1:3])
-                    weeks.append((week_num, week_dir))
-                except ValueError:
-                    continue
-
-        # ソートして追加
-        for week_num, week_dir in sorted(weeks):
-            # プロンプトと問題文の有無をチェック
-            has_prompt = (week_dir / "prompt.txt").exists()
-            has_problem = (week_dir / "problem.tex").exists()
+        self._scan_serial += 1
+        task = WeekScanTask(term, self._scan_serial)
+        task.signals.finished.connect(self._on_weeks_scanned)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_weeks_scanned(self, serial: int, term: str, weeks: list):
+        """走査完了"""
+        if serial != self._scan_serial:
+            return  # 後から走査し直している
+
+        self._weeks_cache[term] = {w: (p, t) for w, p, t in weeks}
+        self._watch_term(term)
+        if term == self.term_combo.currentText():
+            self._populate_weeks(self._weeks_cache[term])
+
+    def _populate_weeks(self, weeks: dict[int, tuple[bool, bool]]):
+        """週リストを作り直す（選択中の週は維持）"""
+        current_week = self._current_week
+        self.week_list.setUpdatesEnabled(False)
+        self.week_list.blockSignals(True)
+        try:
+            self._fill_week_list(weeks)
+            item = self._week_items.get(current_week)
+            if item is not None:
+                self.week_list.setCurrentItem(item)
+        finally:
+            self.week_list.blockSignals(False)
+            self.week_list.setUpdatesEnabled(True)
+        if current_week is not None and current_week not in self._week_items:
+            self._clear_detail()
 
-            status = ""
-            if has_prompt and has_problem:
-                status = " ✓"
-            elif has_prompt or has_problem:
-                status = " △"
+    def _fill_week_list(self, weeks: dict[int, tuple[bool, bool]]):
+        """週リストの項目を作成"""
+        self.week_list.clear()
+        self._week_items.clear()
+        if not weeks:
+            self.new_week_spin.setValue(1)
+            return
 
-            item = QListWidgetItem(f"第{week_num:02d}週{status}")
+        for week_num, (has_prompt, has_problem) in sorted(weeks.items()):
+            item = QListWidgetItem()
             item.setData(Qt.ItemDataRole.UserRole, week_num)
             self.week_list.addItem(item)
+            self._week_items[week_num] = item
+            self._set_item_status(week_num, has_prompt, has_problem)
 
         # 次の週番号を設定
-        if weeks:
-            max_week = max(w[0] for w in weeks)
-            self.new_week_spin.setValue(min(max_week + 1, 22))
-        else:
-            self.new_week_spin.setValue(1)
+        self.new_week_spin.setValue(min(max(weeks) + 1, 22))
+
+    def _set_item_status(self, week_num: int, has_prompt: bool, has_problem: bool):
+        """週リスト項目の状態表示だけを更新"""
+        item = self._week_items.get(week_num)
+        if item is None:
+            return
+        weeks = self._weeks_cache.get(self.term_combo.currentText())
+        if weeks is not None:
+            weeks[week_num] = (has_prompt, has_problem)
+
+        item.setText(f"第{week_num:02d}週{_WEEK_STATUS[has_prompt + has_problem]}")
+
+    def _update_current_status(self, **flags: bool):
+        """選択中の週の状態表示を更新（prompt/problemの片方だけ変更）"""
+        weeks = self._weeks_cache.get(self.term_combo.currentText(), {})
+        has_prompt, has_problem = weeks.get(self._current_week, (False, False))
+        self._set_item_status(
+            self._current_week,
+            flags.get("has_prompt", has_prompt),
+            flags.get("has_problem", has_problem),
+        )
 
     def _on_term_changed(self, term: str):
         """学期変更"""
-        self._refresh_weeks()
         self._clear_detail()
+        self._refresh_weeks()
 
     def _on_week_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
         """週選択"""
@@ -239,44 +369,65 @@ class WeekManagerPanel(QWidget):
         self.save_prompt_btn.setEnabled(True)
         self.save_problem_btn.setEnabled(True)
 
-        week_path = Config.get_week_path(term, week_num)
+        week_path = Config.get_week_path_cached(term, week_num)
+        self._current_week_path = week_path
+        self._current_prompt_path = week_path / "prompt.txt"
+        self._current_problem_path = week_path / "problem.tex"
 
         # problem.tex読み込み
-        problem_data = self._load_problem_tex(week_path)
+        problem_data = self._load_problem_tex(self._current_problem_path)
         self.week_title_edit.setText(problem_data["週タイトル"])
         self.theme_edit.setText(problem_data["テーマ"])
         self.problem_text_edit.setText(problem_data["問題文"])
 
         # プロンプト読み込み
-        prompt_file = week_path / "prompt.txt"
-        if prompt_file.exists():
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                self.prompt_edit.setText(f.read())
-        else:
-            self.prompt_edit.clear()
-
-    def _load_problem_tex(self, week_path: Path) -> dict:
-        """problem.texを読み込んで変数を抽出"""
-        problem_file = week_path / "problem.tex"
+        self._set_prompt_text(self._read_cached(self._current_prompt_path) or "")
 
+    def _read_cached(self, path: Path) -> str | None:
+        """テキストファイルを読み込み（更新日時とサイズが同じならキャッシュを返す、なければNone）"""
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            self._file_cache.pop(key, None)
+            return None
+
+        cached = self._file_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        text = path.read_bytes().decode("utf-8", errors="replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")  # 旧形式（テキストモード書き込み）のCRLF
+        self._file_cache[key] = (st.st_mtime_ns, st.st_size, text)
+        return text
+
+    def _set_prompt_text(self, text: str):
+        """採点基準をエディタへ読み込み（シグナルとUndo記録を止めて一括設定）"""
+        self.prompt_edit.setUndoRedoEnabled(False)
+        blocker = QSignalBlocker(self.prompt_edit)
+        self.prompt_edit.setPlainText(text)
+        del blocker
+        self.prompt_edit.setUndoRedoEnabled(True)
+
+    def _load_problem_tex(self, problem_file: Path) -> dict:
+        """problem.texを読み込んで変数を抽出"""
         defaults = {
             "週タイトル": f"{self._current_term}第{self._current_week:02d}週" if self._current_term and self._current_week else "",
             "テーマ": "",
             "問題文": ""
         }
 
-        if not problem_file.exists():
+        content = self._read_cached(problem_file)
+        if content is None:
             return defaults
 
-        with open(problem_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        for key in defaults.keys():
-            # \def\キー{値} パターンを抽出（複数行対応）
-            pattern = rf'\\def\\{key}\{{((?:[^{{}}]|\{{[^{{}}]*\}})*)\}}'
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                defaults[key] = match.group(1)
+        found = set()
+        for match in _PROBLEM_DEF_RE.finditer(content):
+            key = match.group(1)
+            if key not in found:  # 同じキーが複数あれば最初の定義を使う
+                found.add(key)
+                defaults[key] = match.group(2)
 
         return defaults
 
@@ -284,11 +435,14 @@ class WeekManagerPanel(QWidget):
         """詳細をクリア"""
         self._current_term = None
         self._current_week = None
+        self._current_week_path = None
+        self._current_prompt_path = None
+        self._current_problem_path = None
         self.week_info.setText("週を選択してください")
         self.week_title_edit.clear()
         self.theme_edit.clear()
         self.problem_text_edit.clear()
-        self.prompt_edit.clear()
+        self._set_prompt_text("")
         self.save_prompt_btn.setEnabled(False)
         self.save_problem_btn.setEnabled(False)
 
@@ -297,18 +451,21 @@ class WeekManagerPanel(QWidget):
         term = self.term_combo.currentText()
         week_num = self.new_week_spin.value()
 
-        week_path = Config.get_week_path(term, week_num)
+        week_path = Config.get_week_path_cached(term, week_num)
 
-        if week_path.exists():
+        try:
+            week_path.mkdir(parents=True, exist_ok=False)
+        except FileExistsError:
             QMessageBox.warning(
                 self, "追加エラー",
                 f"{term} 第{week_num:02d}週 は既に存在します"
             )
             return
+        except OSError as e:
+            QMessageBox.critical(self, "エラー", f"追加に失敗しました:\n{e}")
+            return
 
         try:
-            week_path.mkdir(parents=True, exist_ok=True)
-
             # デフォルトのproblem.texを作成
             problem_file = week_path / "problem.tex"
             default_problem = f"""% {term}第{week_num:02d}週
@@ -316,8 +473,7 @@ class WeekManagerPanel(QWidget):
 \\def\\テーマ{{Writing Practice}}
 \\def\\問題文{{問題文を入力してください。}}
 """
-            with open(problem_file, "w", encoding="utf-8") as f:
-                f.write(default_problem)
+            _write_text_atomic(problem_file, default_problem)
 
             # デフォルトのプロンプトを作成
             prompt_file = week_path / "prompt.txt"
@@ -332,10 +488,12 @@ class WeekManagerPanel(QWidget):
 - 文法ミス: -1点/箇所
 - スペルミス: -0.5点/箇所
 """
-            with open(prompt_file, "w", encoding="utf-8") as f:
-                f.write(default_prompt)
+            _write_text_atomic(prompt_file, default_prompt)
 
+            if term in self._weeks_cache:
+                self._weeks_cache[term][week_num] = (True, True)
             self._refresh_weeks()
+            self._watch_term(term)
             self.week_updated.emit()
 
             QMessageBox.information(
@@ -351,8 +509,7 @@ class WeekManagerPanel(QWidget):
         if not self._current_term or not self._current_week:
             return
 
-        week_path = Config.get_week_path(self._current_term, self._current_week)
-        problem_file = week_path / "problem.tex"
+        problem_file = self._current_problem_path
 
         # 入力値を取得
         week_title = self.week_title_edit.text() or f"{self._current_term}第{self._current_week:02d}週"
@@ -366,10 +523,10 @@ class WeekManagerPanel(QWidget):
 """
 
         try:
-            with open(problem_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            self._file_cache.pop(str(problem_file), None)
+            _write_text_atomic(problem_file, content)
 
-            self._refresh_weeks()
+            self._update_current_status(has_problem=True)
             self.week_updated.emit()
 
             QMessageBox.information(self, "保存完了", "問題文を保存しました")
@@ -382,14 +539,13 @@ class WeekManagerPanel(QWidget):
         if not self._current_term or not self._current_week:
             return
 
-        week_path = Config.get_week_path(self._current_term, self._current_week)
-        prompt_file = week_path / "prompt.txt"
+        prompt_file = self._current_prompt_path
 
         try:
-            with open(prompt_file, "w", encoding="utf-8") as f:
-                f.write(self.prompt_edit.toPlainText())
+            self._file_cache.pop(str(prompt_file), None)
+            _write_text_atomic(prompt_file, self.prompt_edit.toPlainText())
 
-            self._refresh_weeks()
+            self._update_current_status(has_prompt=True)
             self.week_updated.emit()
 
             QMessageBox.information(self, "保存完了", "採点基準を保存しました")
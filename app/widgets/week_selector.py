@@ -24,37 +24,31 @@ class WeekSelectorWidget(QWidget):
         super().__init__()
         self._current_pdf_path: str | None = None
         self._pipeline_worker: PipelineWorker | None = None
+        self._loaded = False  # 初めて表示されたときに読み込む
         self._setup_ui()
-        self._load_current_week()
+
+    def showEvent(self, event):
+        """初回表示時に現在の週とプロンプトを読み込む（起動時の読み込みを避ける）"""
+        if not self._loaded:
+            self._loaded = True
+            self._load_current_week()
+        super().showEvent(event)
 
     def _setup_ui(self):
-        """UI構築"""
+        """UI構築（スタイルは app.qss の #weekSelector 以下で定義）"""
+        self.setObjectName("weekSelector")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(24)
 
         # タイトル
         title = QLabel("週選択とPDF読み込み")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #37352f;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
         # 週選択グループ
         week_group = QGroupBox("週を選択")
-        week_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding: 16px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 16px;
-                padding: 0 8px;
-            }
-        """)
+        week_group.setObjectName("weekGroup")
         week_layout = QHBoxLayout(week_group)
 
         # 学期選択
@@ -90,15 +84,7 @@ class WeekSelectorWidget(QWidget):
         self.prompt_display = QTextEdit()
         self.prompt_display.setReadOnly(True)
         self.prompt_display.setMinimumHeight(200)
-        self.prompt_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #fafafa;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
+        self.prompt_display.setObjectName("promptDisplay")
         prompt_layout.addWidget(self.prompt_display)
 
         layout.addWidget(prompt_group)
@@ -110,7 +96,7 @@ class WeekSelectorWidget(QWidget):
         # ファイル選択行
         file_row = QHBoxLayout()
         self.file_label = QLabel("ファイル未選択")
-        self.file_label.setStyleSheet("color: #9b9a97;")
+        self.file_label.setObjectName("fileLabel")
         file_row.addWidget(self.file_label, 1)
 
         browse_btn = QPushButton("PDFを選択...")
@@ -122,23 +108,7 @@ class WeekSelectorWidget(QWidget):
         # 処理開始ボタン
         self.process_btn = QPushButton("DyNAMiKS処理 → クロップ → 読み込み")
         self.process_btn.setEnabled(False)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2eaadc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2496c4;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.process_btn.setObjectName("processButton")
         self.process_btn.clicked.connect(self._start_processing)
         pdf_layout.addWidget(self.process_btn)
 
@@ -148,7 +118,7 @@ class WeekSelectorWidget(QWidget):
         pdf_layout.addWidget(self.progress_bar)
 
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #9b9a97; font-size: 12px;")
+        self.status_label.setObjectName("statusLabel")
         pdf_layout.addWidget(self.status_label)
 
         layout.addWidget(pdf_group)
@@ -183,13 +153,11 @@ class WeekSelectorWidget(QWidget):
         """プロンプト読み込み"""
         term = self.term_combo.currentText()
         week = self.week_spin.value()
-        week_path = Config.get_week_path(term, week)
-        prompt_file = week_path / "prompt.txt"
+        prompt_file = Config.get_week_path_cached(term, week) / "prompt.txt"
 
-        if prompt_file.exists():
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                self.prompt_display.setText(f.read())
-        else:
+        try:
+            self.prompt_display.setPlainText(prompt_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
             self.prompt_display.setText(f"プロンプトファイルが見つかりません:\n{prompt_file}")
 
     def open_pdf_dialog(self):
@@ -203,13 +171,17 @@ class WeekSelectorWidget(QWidget):
         if file_path:
             self._current_pdf_path = file_path
             self.file_label.setText(Path(file_path).name)
-            self.file_label.setStyleSheet("color: #37352f;")
+            self.file_label.setProperty("selected", True)
+            self.file_label.style().unpolish(self.file_label)
+            self.file_label.style().polish(self.file_label)
             self.process_btn.setEnabled(True)
 
     def _start_processing(self):
         """DyNAMiKS処理開始"""
         if not self._current_pdf_path:
             return
+        if self._pipeline_worker is not None and self._pipeline_worker.isRunning():
+            return  # 処理は同時に1つだけ
 
         # UI更新
         self.process_btn.setEnabled(False)
@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QLineEdit, QGroupBox, QPushButton, QFileDialog,
     QComboBox, QProgressBar, QTextEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QProcess
 
 from app.utils.roster_manager import ClassRoster, generate_meibo_tex
 from app.utils.config import Config
@@ -86,7 +86,7 @@ class LatexCompileWorker(QThread):
                 # 週別問題のパスを正しいパス（絶対パス）に書き換え
                 # 元: \input{../週別問題/\学期/第\週番号 週/problem.tex}
                 # 新: \input{/Users/.../weeks/後期/第14週/problem.tex}
-                problem_path = Config.WEEKS_PATH / self.term / f"第{self.week:02d}週" / "problem.tex"
+                problem_path = Config.get_week_path_cached(self.term, self.week) / "problem.tex"
                 content = re.sub(
                     r'\\input\{[^}]*problem\.tex\}',
                     r'\\input{' + str(problem_path).replace('\\', '/') + r'}',
@@ -155,7 +155,7 @@ class LatexCompileWorker(QThread):
                 final_name = f"添削用紙_{self.term}_{self.week:02d}週_{self.class_code}.pdf"
                 final_path = Config.APP_DATA_DIR / "worksheets" / final_name
                 final_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(output_pdf, final_path)
+                shutil.copyfile(output_pdf, final_path)
 
                 self.progress.emit("完了!")
                 self.finished.emit(str(final_path))
@@ -171,7 +171,7 @@ class LatexCompileWorker(QThread):
     def _prepare_problem_tex(self):
         """問題ファイルを準備（なければダミーを生成）"""
         # 週別問題のパス
-        week_dir = Config.WEEKS_PATH / self.term / f"第{self.week:02d}週"
+        week_dir = Config.get_week_path_cached(self.term, self.week)
         problem_tex = week_dir / "problem.tex"
 
         if not problem_tex.exists():
@@ -455,7 +455,7 @@ class WorksheetPanel(QWidget):
         )
 
         # Finderで開く
-        subprocess.run(["open", "-R", pdf_path], check=False)
+        QProcess.startDetached("open", ["-R", pdf_path])
 
     def _on_error(self, error: str):
         """エラー"""
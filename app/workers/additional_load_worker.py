@@ -0,0 +1,43 @@
+"""追加答案読み込みワーカー"""
+
+from __future__ import annotations
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from app.utils.additional_answer_manager import AdditionalAnswerManager, AdditionalAnswerItem
+
+
+class AdditionalLoadWorker(QThread):
+    """年度ディレクトリから未採点の追加答案を収集するワーカー"""
+
+    loaded = pyqtSignal(int, list)  # 通番, list[AdditionalAnswerItem]
+    error = pyqtSignal(int, str)  # 通番, エラーメッセージ
+
+    def __init__(self, year_dir: Path, serial: int, parent=None):
+        super().__init__(parent)
+        self.year_dir = Path(year_dir)
+        self.serial = serial
+
+    def run(self):
+        """ディレクトリ走査を実行"""
+        try:
+            all_items = AdditionalAnswerManager.list_all_additional_answers(self.year_dir)
+
+            # AdditionalAnswerItem に変換
+            items = []
+            for item_data in all_items:
+                if not item_data.get("graded", False):
+                    items.append(AdditionalAnswerItem(
+                        filename=item_data["filename"],
+                        student_name=item_data["student_name"],
+                        attendance_no=item_data["attendance_no"],
+                        class_name=item_data.get("class_name", ""),
+                        target_week=item_data["target_week"],
+                        target_term=item_data["target_term"],
+                        qr_data=item_data.get("qr_data", ""),
+                        graded=item_data.get("graded", False),
+                    ))
+
+            self.loaded.emit(self.serial, items)
+        except Exception as e:
+            self.error.emit(self.serial, str(e))
@@ -91,7 +91,7 @@ class PipelineWorker(QThread):
 
         # 一時ディレクトリにコピーして処理（scancropは入力ファイルと同じ場所に出力するため）
         temp_pdf = self._temp_dir / input_path.name
-        shutil.copy2(input_path, temp_pdf)
+        shutil.copyfile(input_path, temp_pdf)
 
         # scancropコマンド（QRコード読み取り＆ページソート）
         # 注: --crop オプションはDyNAMiKS三点マークでの傾き補正用だが、
@@ -19,6 +19,9 @@ DATA_FILES = [
         'app/resources/templates/base_template.tex',
         'app/resources/templates/base_template.pdf',
     ]),
+    ('app/resources/styles', [
+        'app/resources/styles/app.qss',
+    ]),
 ]
 OPTIONS = {
     'argv_emulation': False,
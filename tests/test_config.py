@@ -0,0 +1,88 @@
+"""設定管理のテスト"""
+
+import pytest
+
+from app.utils.config import Config
+
+
+@pytest.fixture
+def stamps_dir(tmp_path, monkeypatch):
+    """一時スタンプフォルダ"""
+    stamps_path = tmp_path / "stamps"
+    stamps_path.mkdir()
+    monkeypatch.setattr(Config, "STAMPS_PATH", stamps_path)
+    return stamps_path
+
+
+class TestGetStampsForCategory:
+    """get_stamps_for_category のテスト"""
+
+    @pytest.mark.parametrize("ext", Config.STAMP_EXTENSIONS)
+    def test_each_extension(self, stamps_dir, ext):
+        """対象拡張子の画像を取得"""
+        category = stamps_dir / "excellent"
+        category.mkdir()
+        stamp = category / f"stamp{ext}"
+        stamp.write_bytes(b"")
+
+        assert Config.get_stamps_for_category("excellent") == [stamp]
+
+    def test_uppercase_extension(self, stamps_dir):
+        """大文字の拡張子も対象"""
+        category = stamps_dir / "excellent"
+        category.mkdir()
+        for name in ("a.PNG", "b.JPG", "c.Jpeg", "d.GIF"):
+            (category / name).write_bytes(b"")
+
+        stamps = Config.get_stamps_for_category("excellent")
+        assert [p.name for p in stamps] == ["a.PNG", "b.JPG", "c.Jpeg", "d.GIF"]
+
+    def test_excludes_other_files_and_directories(self, stamps_dir):
+        """画像以外のファイル・拡張子が一致するディレクトリは対象外"""
+        category = stamps_dir / "excellent"
+        category.mkdir()
+        (category / "stamp.png").write_bytes(b"")
+        (category / "note.txt").write_text("memo", encoding="utf-8")
+        (category / "stamp.png.bak").write_bytes(b"")
+        (category / "folder.png").mkdir()
+
+        stamps = Config.get_stamps_for_category("excellent")
+        assert [p.name for p in stamps] == ["stamp.png"]
+
+    def test_sorted(self, stamps_dir):
+        """パス順にソートして返す"""
+        category = stamps_dir / "excellent"
+        category.mkdir()
+        for name in ("c.gif", "a.png", "b.jpg", "a.jpeg"):
+            (category / name).write_bytes(b"")
+
+        stamps = Config.get_stamps_for_category("excellent")
+        assert [p.name for p in stamps] == ["a.jpeg", "a.png", "b.jpg", "c.gif"]
+
+    def test_missing_category(self, stamps_dir):
+        """存在しないカテゴリは空"""
+        assert Config.get_stamps_for_category("missing") == []
+
+
+class TestWeekPathCached:
+    """get_week_path_cached のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """テストの前後でキャッシュを空にする"""
+        Config.get_week_path_cached.cache_clear()
+        yield
+        Config.get_week_path_cached.cache_clear()
+
+    def test_same_as_get_week_path(self):
+        """get_week_path と同じパスを返し、2回目以降は同じオブジェクトを使い回す"""
+        path = Config.get_week_path_cached("前期", 5)
+        assert path == Config.get_week_path("前期", 5)
+        assert Config.get_week_path_cached("前期", 5) is path
+
+    def test_cache_clear_after_weeks_path_change(self, tmp_path, monkeypatch):
+        """WEEKS_PATH を変更したら cache_clear で新しいパスになる"""
+        Config.get_week_path_cached("前期", 5)
+        monkeypatch.setattr(Config, "WEEKS_PATH", tmp_path / "weeks")
+        Config.get_week_path_cached.cache_clear()
+        assert Config.get_week_path_cached("前期", 5) == tmp_path / "weeks" / "前期" / "第05週"
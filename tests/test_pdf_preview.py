@@ -0,0 +1,107 @@
+"""PDFプレビューウィジェットのテスト"""
+
+import os
+import time
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PyQt6.QtWidgets")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QThreadPool  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from app.widgets.pdf_preview import PDFPreviewWidget  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """QApplication（プロセスで1つ）"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def preview(qapp):
+    """表示済みのプレビューウィジェット"""
+    widget = PDFPreviewWidget()
+    widget.show()
+    yield widget
+    widget.clear()
+    widget.close()
+    QThreadPool.globalInstance().waitForDone(3000)
+
+
+def _make_pdf(path, pages: int) -> str:
+    """テスト用PDFを作成"""
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"page {i + 1}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _settle(qapp):
+    """ワーカーの完了とキューされたシグナル・タイマーを処理"""
+    for _ in range(20):
+        QThreadPool.globalInstance().waitForDone(1000)
+        qapp.processEvents()
+        time.sleep(0.02)
+
+
+class TestNavigationAfterRender:
+    """レンダリング完了後のページ移動・再読み込み（完了済みタスクの参照が残らないこと）"""
+
+    @pytest.mark.parametrize("pages", [1, 3])
+    def test_navigate_and_reload(self, qapp, preview, tmp_path, pages):
+        """読み込み → 前後移動 → 再読み込みでエラーにならない"""
+        pdf_path = _make_pdf(tmp_path / f"doc{pages}.pdf", pages)
+
+        preview.load_pdf(pdf_path)
+        _settle(qapp)
+        preview._next_page()
+        _settle(qapp)
+        preview._prev_page()
+        _settle(qapp)
+        preview.load_pdf(pdf_path)
+        _settle(qapp)
+
+        assert preview.page_count == pages
+        assert preview.current_page == 1
+        assert not preview._live_tasks  # 完了したタスクは保持を解除済み
+
+    def test_rapid_navigation(self, qapp, preview, tmp_path):
+        """描画完了を待たずに移動を繰り返しても、取り消し済み・完了済みのタスクでエラーにならない"""
+        preview.load_pdf(_make_pdf(tmp_path / "doc.pdf", 10))
+        for i in range(60):
+            if i % 5 < 3:
+                preview._next_page()
+            else:
+                preview._prev_page()
+            qapp.processEvents()
+        _settle(qapp)
+
+        assert not preview._live_tasks
+        assert not preview._prefetch_tasks
+
+
+class TestStoreShrink:
+    """MuPDFストアの解放（プロセス共有のため、ドキュメントを持つプレビューだけが行う）"""
+
+    def test_hide_without_document_skips_shrink(self, qapp, preview, monkeypatch):
+        """PDFを開いていないプレビューは非表示にしてもストアに触れない"""
+        calls = []
+        monkeypatch.setattr(fitz.TOOLS, "store_shrink", lambda percent: calls.append(percent))
+        preview.hide()
+        assert calls == []
+
+    def test_hide_with_document_shrinks(self, qapp, preview, tmp_path, monkeypatch):
+        """PDFを開いているプレビューは非表示時にストアを解放"""
+        preview.load_pdf(_make_pdf(tmp_path / "doc.pdf", 1))
+        _settle(qapp)
+        calls = []
+        monkeypatch.setattr(fitz.TOOLS, "store_shrink", lambda percent: calls.append(percent))
+        preview.hide()
+        assert calls == [100]
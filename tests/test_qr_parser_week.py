@@ -5,6 +5,7 @@ from app.utils.qr_parser import (
     parse_qr_value,
     extract_week_info,
     is_different_week,
+    find_scancrop_output,
 )
 
 
@@ -72,3 +73,49 @@ class TestIsDifferentWeek:
             current_week=13,
             current_term="後期"
         ) is False
+
+
+class TestFindScancropOutput:
+    """find_scancrop_output のテスト"""
+
+    def test_qrcode_txt_wins_over_csv(self, tmp_path):
+        """*-QRcode.txt は CSV より優先"""
+        (tmp_path / "scan-QRcode.txt").write_text("1,2025_後期_13_A_01_QRテキスト\n", encoding="utf-8")
+        (tmp_path / "scan.csv").write_text("code\n2025_後期_13_A_02_CSV\n", encoding="utf-8")
+
+        students = find_scancrop_output(tmp_path)
+        assert [s.name for s in students] == ["QRテキスト"]
+
+    def test_csv_wins_over_txt(self, tmp_path):
+        """CSV はその他のテキストより優先"""
+        (tmp_path / "scan.csv").write_text("code\n2025_後期_13_A_02_CSV\n", encoding="utf-8")
+        (tmp_path / "output.txt").write_text("2025_後期_13_A_03_テキスト\n", encoding="utf-8")
+
+        students = find_scancrop_output(tmp_path)
+        assert [s.name for s in students] == ["CSV"]
+
+    def test_falls_back_to_txt(self, tmp_path):
+        """QRcode.txt・CSVがなければその他のテキスト"""
+        (tmp_path / "output.txt").write_text("2025_後期_13_A_03_テキスト\n", encoding="utf-8")
+
+        students = find_scancrop_output(tmp_path)
+        assert [s.name for s in students] == ["テキスト"]
+        assert students[0].page == 1
+
+    def test_skips_directories(self, tmp_path):
+        """拡張子が一致してもディレクトリは対象外"""
+        (tmp_path / "dir-QRcode.txt").mkdir()
+        (tmp_path / "dir.csv").mkdir()
+        (tmp_path / "output.txt").write_text("2025_後期_13_A_03_テキスト\n", encoding="utf-8")
+
+        students = find_scancrop_output(tmp_path)
+        assert [s.name for s in students] == ["テキスト"]
+
+    def test_missing_directory(self, tmp_path):
+        """存在しないディレクトリは空（生徒なし）"""
+        assert find_scancrop_output(tmp_path / "missing") == []
+
+    def test_no_output_files(self, tmp_path):
+        """出力ファイルがなければ空"""
+        (tmp_path / "scan.pdf").write_bytes(b"%PDF-1.4")
+        assert find_scancrop_output(tmp_path) == []